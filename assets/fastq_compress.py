@@ -0,0 +1,170 @@
+import argparse
+import gzip
+import hashlib
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Define the directory where the fastq files are located
+directory = "/home/cbr16/Documents/WeeYeZhi/input"
+
+# FASTQ files compressed when no file is given on the command line (same list as gzip.sh)
+FILES = ["SRR9038731.fastq", "SRR9038732.fastq"] + [
+    f"{run}_{mate}.fastq"
+    for run in ["SRR11266556", "SRR11266555", "SRR11266554", "SRR9038729", "SRR9038730", "SRR9038731", "SRR9038732",
+                "SRR9038733", "SRR9038734", "SRR9690969", "SRR9690970", "SRR9690971", "SRR9690972", "SRR9690973",
+                "SRR9690974"]
+    for mate in (1, 2)
+]
+
+SUFFIX = {"bgzf": ".gz", "gzip": ".gz", "zstd": ".zst"}
+DEFAULT_LEVEL = {"bgzf": 6, "gzip": 6, "zstd": 3}
+
+# Uncompressed bytes handed to a worker per task; every chunk is compressed independently
+CHUNK_SIZE = 1 << 24
+
+# Largest uncompressed payload of one BGZF block (same as htslib), so the block stays under 64 KiB
+BGZF_BLOCK = 0xFF00
+
+# Empty BGZF block that marks the end of a BGZF file
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+# ---- COMPRESSION ----
+
+def bgzf_block(data, level):
+    # One gzip member with the BC extra field holding the total block size - 1 (SAM/BAM spec, section 4.1)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    deflated = compressor.compress(data) + compressor.flush()
+    if len(deflated) + 25 > 0x10000:
+        # Incompressible data: stored blocks always fit
+        compressor = zlib.compressobj(0, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+    header = struct.pack("<4BI2BH2BHH", 0x1F, 0x8B, 8, 4, 0, 0, 0xFF, 6, ord("B"), ord("C"), 2, len(deflated) + 25)
+    return header + deflated + struct.pack("<2I", zlib.crc32(data), len(data))
+
+def compress_chunk(data, fmt, level):
+    # Runs in the worker processes. Every format yields a self-contained piece, so the pieces can
+    # simply be concatenated: zcat / gzip -d read multi-member gzip and zstd -d reads multi-frame zstd
+    if fmt == "bgzf":
+        return b"".join(bgzf_block(data[i:i + BGZF_BLOCK], level) for i in range(0, len(data), BGZF_BLOCK))
+    if fmt == "gzip":
+        return gzip.compress(data, level, mtime=0)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+def open_decompressed(path, fmt):
+    if fmt == "zstd":
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+    return gzip.open(path, "rb")
+
+def checksum(fh, chunk_size=CHUNK_SIZE):
+    digest, size = hashlib.sha256(), 0
+    while chunk := fh.read(chunk_size):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+def compress_file(path, executor, fmt="bgzf", level=6, chunk_size=CHUNK_SIZE, in_flight=8, verify=True, keep=False,
+                  force=False):
+    # Chunks are read, hashed and sent to the process pool while up to `in_flight` earlier chunks are
+    # still being compressed; results are written in order. The output is written to <output>.tmp and
+    # only renamed (and the FASTQ removed, as gzip does) once the decompressed output hashes back to
+    # the same SHA-256 as the input
+    output = path + SUFFIX[fmt]
+    if os.path.exists(output) and not force:
+        raise FileExistsError(f"Error: '{output}' already exists (use --force to overwrite it).")
+    started = time.perf_counter()
+    digest, size = hashlib.sha256(), 0
+    pending = deque()
+    try:
+        with open(path, "rb") as fh, open(output + ".tmp", "wb") as out:
+            while chunk := fh.read(chunk_size):
+                digest.update(chunk)
+                size += len(chunk)
+                pending.append(executor.submit(compress_chunk, chunk, fmt, level))
+                if len(pending) >= in_flight:
+                    out.write(pending.popleft().result())
+            while pending:
+                out.write(pending.popleft().result())
+            if fmt == "bgzf":
+                out.write(BGZF_EOF)
+        if verify:
+            with open_decompressed(output + ".tmp", fmt) as fh:
+                if checksum(fh) != (digest.hexdigest(), size):
+                    raise RuntimeError(f"Error: '{output}' does not decompress back to '{path}'.")
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        if os.path.exists(output + ".tmp"):
+            os.remove(output + ".tmp")
+        raise
+    os.replace(output + ".tmp", output)
+    if not keep:
+        os.remove(path)
+    return {"file": path, "output": output, "size": size, "compressed": os.path.getsize(output),
+            "sha256": digest.hexdigest(), "verified": verify, "seconds": time.perf_counter() - started}
+
+def compress_files(paths, fmt="bgzf", level=None, processes=None, jobs=2, chunk_size=CHUNK_SIZE, verify=True,
+                   keep=False, force=False):
+    # One process pool shared by `jobs` files compressed at the same time; yields a result per file
+    if fmt == "zstd" and zstandard is None:
+        raise RuntimeError("Error: --format zstd needs the zstandard package (pip install zstandard).")
+    level = DEFAULT_LEVEL[fmt] if level is None else level
+    processes = processes or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=processes) as executor, ThreadPoolExecutor(max_workers=jobs) as files:
+        futures = {path: files.submit(compress_file, path, executor, fmt, level, chunk_size,
+                                      max(2, 2 * processes // jobs), verify, keep, force) for path in paths}
+        for path, future in futures.items():
+            try:
+                yield future.result()
+            except (OSError, RuntimeError) as error:
+                yield {"file": path, "error": str(error)}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compress FASTQ files with all cores into BGZF / multi-member gzip (readable by zcat) or zstd")
+    parser.add_argument("files", nargs="*", help=f"files to compress (default: the FASTQ files of gzip.sh in {directory})")
+    parser.add_argument("-f", "--format", choices=list(SUFFIX), default="bgzf",
+                        help="bgzf (default, also indexable by samtools/tabix), gzip (one member per chunk, "
+                             "slightly smaller) or zstd (fast intermediates, needs the zstandard package)")
+    parser.add_argument("-l", "--level", type=int, default=None, help="compression level (default: 6, zstd: 3)")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="compression processes (default: all cores)")
+    parser.add_argument("-j", "--jobs", type=int, default=2, help="files compressed at the same time")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_SIZE >> 20, help="MB handed to a process at a time")
+    parser.add_argument("-k", "--keep", action="store_true", help="keep the original files")
+    parser.add_argument("--force", action="store_true", help="overwrite existing compressed files")
+    parser.add_argument("--no-verify", action="store_true", help="skip the decompress-and-compare check")
+    args = parser.parse_args()
+
+    if args.files:
+        paths = args.files
+    else:
+        paths = [os.path.join(directory, name) for name in FILES if os.path.isfile(os.path.join(directory, name))]
+        for name in FILES:
+            if not os.path.isfile(os.path.join(directory, name)):
+                print(f"File {name} not found!")
+
+    failed = 0
+    try:
+        for result in compress_files(paths, args.format, args.level, args.processes, args.jobs, args.chunk_mb << 20,
+                                     not args.no_verify, args.keep, args.force):
+            if "error" in result:
+                failed += 1
+                print(result["error"], file=sys.stderr)
+                continue
+            print(f"{result['file']} -> {result['output']}: {result['size'] / 2 ** 20:.1f} MB -> "
+                  f"{result['compressed'] / 2 ** 20:.1f} MB ({result['compressed'] / max(1, result['size']):.1%}) in "
+                  f"{result['seconds']:.1f} s ({result['size'] / 2 ** 20 / max(result['seconds'], 1e-9):.0f} MB/s)"
+                  + (", verified" if result["verified"] else ""))
+    except RuntimeError as error:
+        sys.exit(str(error))
+    print("All files have been processed." if not failed else f"{failed} file(s) could not be compressed.")
+    sys.exit(1 if failed else 0)
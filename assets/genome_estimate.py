@@ -1,72 +1,539 @@
+import argparse
+import csv
+import glob
+import hashlib
+import json
 import os
-import matplotlib.pyplot as plt
+import re
+import sqlite3
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+
+import numpy as np
 
 # Specify the exact path of the .histo file
 histo_file = os.path.join("/media/Raid/Wee/WeeYeZhi/output/Jellyfishresults/jellyfish_k_21", "k_21_mer_counts.histo")
 
-# Check if the file exists
-if not os.path.exists(histo_file):
-    raise FileNotFoundError(f"Error: The file '{histo_file}' does not exist.")
-
-def make_plot(coverage, frequency, cov_peak):
-    plt.plot(coverage, frequency)
-    plt.xlabel("Coverage")
-    plt.ylabel("Frequency")
-    plt.axvline(x=cov_peak, color='r', linestyle="--", label="Coverage Peak")
-    plt.legend()
-    plt.savefig("genome.png")
-    plt.show()
-
-def detect_start(frequency):
-    start = 0
-    for idx in range(len(frequency)):
-        test_list = frequency[idx:idx + 10]
-        if all(i < j for i, j in zip(test_list, test_list[1:])):
-            start = idx
-            break
-    print(f"Start at: {start}")
-    return start
-
-def detect_end(frequency):
-    end = -1
-    for idx in range(len(frequency) - 1, 9, -1):
-        test_list = frequency[idx - 10:idx]
-        if all(i > j for i, j in zip(test_list, test_list[1:])):
-            end = idx
+# Number of bytes read from the .histo source per parsing step
+CHUNK_SIZE = 1 << 24
+
+# Number of consecutive histogram rows that must rise (or fall) to mark the trough (or tail)
+WINDOW = 10
+
+def open_histo(source):
+    # "-" reads the histogram from stdin, a .jf database is piped through `jellyfish histo`,
+    # anything else is treated as a plain two-column .histo file
+    if source == "-":
+        return sys.stdin.buffer, None
+    if str(source).endswith(".jf"):
+        process = subprocess.Popen(["jellyfish", "histo", str(source)], stdout=subprocess.PIPE)
+        return process.stdout, process
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Error: The file '{source}' does not exist.")
+    return open(source, "rb"), None
+
+def parse_histo(fh, chunk_size=CHUNK_SIZE):
+    # Parse the "coverage frequency" rows chunk by chunk straight into int64 arrays,
+    # so only one chunk of raw text is ever held in memory at a time
+    chunks = []
+    remainder = b""
+    while True:
+        block = fh.read(chunk_size)
+        if not block:
             break
-    print(f"End at: {end}")
-    return end
+        block = remainder + block
+        cut = block.rfind(b"\n") + 1
+        remainder = block[cut:]
+        if cut:
+            chunks.append(_parse_block(block[:cut]))
+    if remainder.strip():
+        chunks.append(_parse_block(remainder))
+
+    values = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+    if values.size % 2:
+        raise ValueError("Error: the .histo data is not made of two-column rows.")
+    pairs = values.reshape(-1, 2)
+    return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+def _parse_block(block):
+    return np.fromstring(block.decode("ascii"), dtype=np.int64, sep=" ")
+
+def load_histo(source, chunk_size=CHUNK_SIZE):
+    fh, process = open_histo(source)
+    try:
+        coverage, frequency = parse_histo(fh, chunk_size)
+    finally:
+        if fh is not sys.stdin.buffer:
+            fh.close()
+    if process is not None and process.wait() != 0:
+        raise RuntimeError(f"Error: 'jellyfish histo {source}' exited with status {process.returncode}.")
+    return coverage, frequency
+
+def load_pyplot(show=False):
+    # matplotlib is only imported once a plot is requested; unless the figure is shown on a
+    # display, the Agg backend is forced so headless nodes skip the GUI backend probe
+    import matplotlib
+    if not show or not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY") or os.name == "nt"):
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+def make_plot(coverage, frequency, cov_peak, plot_file, show=False):
+    plt = load_pyplot(show)
+    fig, ax = plt.subplots()
+    ax.plot(coverage, frequency)
+    ax.set_xlabel("Coverage")
+    ax.set_ylabel("Frequency")
+    ax.axvline(x=cov_peak, color='r', linestyle="--", label="Coverage Peak")
+    ax.legend()
+    fig.savefig(plot_file)
+    if show:
+        plt.show()
+    plt.close(fig)
+
+def _runs(flags):
+    # Start (inclusive) and stop (exclusive) index of every run of True flags
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], flags, [False])).view(np.int8)))
+    return edges[0::2], edges[1::2]
+
+def detect_bounds(frequency, width=WINDOW):
+    # Locate the end of the error trough (first strictly increasing run of `width` values)
+    # and the end of the coverage tail (last strictly decreasing run of `width` values)
+    # from the run lengths of the sign of the first difference
+    n = len(frequency)
+    if n < 2:
+        return 0, -1
+    step = np.diff(frequency)
+
+    # A rising run that reaches the last row also counts, as the window is cut short there
+    starts, stops = _runs(step > 0)
+    rising = np.flatnonzero((stops - starts >= width - 1) | (stops == n - 1))
+    start = int(starts[rising[0]]) if rising.size else n - 1
+
+    # The last row of a jellyfish histo is the overflow bin for every count >= --high,
+    # so the falling run may end no later than the second-to-last row
+    starts, stops = _runs(step[:-1] < 0)
+    falling = np.flatnonzero(stops - starts >= width - 1)
+    end = int(stops[falling[-1]]) + 1 if falling.size else -1
+    return start, end
 
 def estimate_coverage_peak(coverage, frequency):
-    higher_freq = max(frequency)
-    coverage_peak = coverage[frequency.index(higher_freq)]
-    print(f"Coverage Peak: {coverage_peak}")
-    return coverage_peak
+    return int(coverage[np.argmax(frequency)])
 
 def estimate_genome_size(coverage, frequency, coverage_peak):
-    area_under_the_curve = sum([c * f for c, f in zip(coverage, frequency)])
-    genome_size = int(area_under_the_curve / coverage_peak)
-    print(f"Estimated Genome Size: {genome_size} bp")
-    return genome_size
+    area_under_the_curve = int(np.dot(coverage, frequency))
+    return int(area_under_the_curve / coverage_peak)
 
-def main(dataset):
-    coverage = [int(entry[0]) for entry in dataset]
-    frequency = [int(entry[1]) for entry in dataset]
+# ---- MODEL-BASED SPECTRUM FIT ----
 
-    start = detect_start(frequency)
-    end = detect_end(frequency)
+# Default k-mer size used to turn the fitted parameters into per-base rates
+KMER_SIZE = 21
 
-    coverage = coverage[start:end]
-    frequency = frequency[start:end]
+# Copy numbers of the negative binomial peaks in the diploid mixture
+PEAKS = np.array([1.0, 2.0, 3.0, 4.0])
 
-    coverage_peak = estimate_coverage_peak(coverage, frequency)
-    genome_size = estimate_genome_size(coverage, frequency, coverage_peak)
+def _peak_weights(a, d):
+    # Expected number of distinct k-mers per haploid genome position in the 1x-4x peaks and
+    # their derivatives, where `a` is the chance that a k-mer spans a heterozygous site and
+    # `d` is the duplicated fraction (GenomeScope-style diploid model)
+    t = 1.0 - a
+    weights = np.array([2 * (1 - d) * a + d * t * a, (1 - d) * t + d * a * a, d * t * a, d * t * t / 2])
+    d_a = np.array([2 * (1 - d) + d * (t - a), -(1 - d) + 2 * d * a, d * (t - a), -d * t])
+    d_d = np.array([-2 * a + t * a, -t + a * a, t * a, t * t / 2])
+    return weights, d_a, d_d
 
-    make_plot(coverage, frequency, coverage_peak)
+def _nb_log_pmf(x, kmer_cov, bias):
+    # Log of the negative binomial pmf of every peak (rows) at every coverage (columns)
+    from scipy.special import gammaln
 
-if __name__ == "__main__":
-    with open(histo_file) as fh:
-        data = fh.readlines()
+    mean = PEAKS[:, None] * kmer_cov
+    size = mean / bias
+    log_ratio = np.log(size / (size + mean))
+    log_pmf = (gammaln(x + size) - gammaln(size) - gammaln(x + 1.0)
+               + size * log_ratio + x * np.log(mean / (size + mean)))
+    return log_pmf, mean, size, log_ratio
+
+def _nb_terms(x, kmer_cov, bias):
+    # Negative binomial pmf of every peak with the derivatives of its log with respect to
+    # the k-mer coverage and the overdispersion
+    from scipy.special import digamma
+
+    log_pmf, mean, size, log_ratio = _nb_log_pmf(x, kmer_cov, bias)
+    tail = (x + size) / (size + mean)
+    d_mean = x / mean - tail
+    d_size = digamma(x + size) - digamma(size) + log_ratio + 1.0 - tail
+    d_cov = PEAKS[:, None] * d_mean + d_size * size / kmer_cov
+    d_bias = -d_size * size / bias
+    return np.exp(log_pmf), d_cov, d_bias
+
+def _model(params, x):
+    # Mixture values only, for the residuals and the error trough (no derivatives)
+    genome, a, d, kmer_cov, bias = params
+    weights = _peak_weights(a, d)[0]
+    return genome * (weights @ np.exp(_nb_log_pmf(x, kmer_cov, bias)[0]))
+
+def _mixture(params, x):
+    genome, a, d, kmer_cov, bias = params
+    weights, d_a, d_d = _peak_weights(a, d)
+    pmf, d_cov, d_bias = _nb_terms(x, kmer_cov, bias)
+    model = genome * (weights @ pmf)
+    jacobian = np.column_stack([
+        weights @ pmf,
+        genome * (d_a @ pmf),
+        genome * (d_d @ pmf),
+        genome * (weights @ (pmf * d_cov)),
+        genome * (weights @ (pmf * d_bias)),
+    ])
+    return model, jacobian
+
+def fit_spectrum(coverage, frequency, start, end, coverage_peak, k=KMER_SIZE):
+    # Fit the heterozygous/duplicated negative binomial mixture to the trimmed spectrum and
+    # derive genome size, heterozygosity, repeat fraction and read error rate from it
+    # (scipy is only imported here so plain and cached estimates start quickly)
+    from scipy.optimize import least_squares
+
+    x = coverage[start:end].astype(np.float64)
+    y = frequency[start:end].astype(np.float64)
+    if x.size < len(PEAKS) + 1 or coverage_peak <= 0:
+        return None
+    area = float(np.dot(x, y))
+
+    def residuals(params):
+        return _model(params, x) - y
+
+    def jacobian(params):
+        return _mixture(params, x)[1]
+
+    # Warm start from the modal coverage, read both as the homozygous (2x) and the
+    # heterozygous (1x) peak, and keep whichever fits better
+    best = None
+    for kmer_cov in (coverage_peak / 2.0, float(coverage_peak)):
+        start_params = [area / (2 * kmer_cov), 0.2, 0.01, kmer_cov, 1.0]
+        lower = [0.0, 0.0, 0.0, 0.5, 1e-6]
+        upper = [np.inf, 0.999, 0.999, float(x[-1]), 1e3]
+        fit = least_squares(residuals, start_params, jac=jacobian, bounds=(lower, upper), x_scale="jac")
+        if best is None or fit.cost < best.cost:
+            best = fit
+    genome, a, d, kmer_cov, bias = best.x
+
+    # k-mers in the error trough that the model does not explain are sequencing errors; the
+    # model is only evaluated over the trough, not the whole (possibly 10^7-row) histogram
+    trough_x = coverage[:start].astype(np.float64)
+    trough_y = frequency[:start].astype(np.float64)
+    error_kmers = float(np.dot(trough_x, np.clip(trough_y - _model(best.x, trough_x), 0, None)))
+    total_kmers = float(np.dot(coverage, frequency))
+    genomic_kmers = total_kmers - error_kmers
+    genome_size = genomic_kmers / (2 * kmer_cov)
+    unique_size = genome * (1 - d)
+
+    return {
+        "model_genome_size": int(genome_size),
+        "heterozygosity": float(1 - (1 - a) ** (1 / k)),
+        "repeat_fraction": float(max(0.0, 1 - unique_size / genome_size)) if genome_size > 0 else 0.0,
+        "error_rate": float(1 - (1 - error_kmers / total_kmers) ** (1 / k)) if total_kmers > 0 else 0.0,
+        "kmer_coverage": float(kmer_cov),
+        "overdispersion": float(bias),
+        "model_fit": float(1 - np.abs(best.fun).sum() / y.sum()),
+    }
+
+@dataclass(slots=True)
+class Estimate:
+    # Result of one estimate; the model fields stay None unless the mixture was fitted,
+    # k and histo are only known when the histogram came from a file
+    start: int
+    end: int
+    coverage_peak: int
+    genome_size: int
+    model_genome_size: int | None = None
+    heterozygosity: float | None = None
+    repeat_fraction: float | None = None
+    error_rate: float | None = None
+    kmer_coverage: float | None = None
+    overdispersion: float | None = None
+    model_fit: float | None = None
+    k: int | None = None
+    histo: str | None = None
+
+    @property
+    def fitted(self):
+        return self.model_genome_size is not None
+
+    def to_dict(self):
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+    @classmethod
+    def from_dict(cls, data):
+        names = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+def estimate(coverage, frequency, width=WINDOW, fit=False, k=KMER_SIZE):
+    # Trim the error trough and the tail, then estimate the peak and the haploid genome size;
+    # works on the arrays alone, so it can be called in-process without any file or stdout I/O
+    coverage = np.asarray(coverage)
+    frequency = np.asarray(frequency)
+    start, end = detect_bounds(frequency, width)
+    coverage_peak = estimate_coverage_peak(coverage[start:end], frequency[start:end])
+    genome_size = estimate_genome_size(coverage[start:end], frequency[start:end], coverage_peak)
+    model = fit_spectrum(coverage, frequency, start, end, coverage_peak, k) if fit else None
+    return Estimate(start, end, coverage_peak, genome_size, **(model or {}))
+
+def report(result):
+    print(f"Start at: {result.start}")
+    print(f"End at: {result.end}")
+    print(f"Coverage Peak: {result.coverage_peak}")
+    print(f"Estimated Genome Size: {result.genome_size} bp")
+    if result.fitted:
+        print(f"Model Genome Size: {result.model_genome_size} bp")
+        print(f"Heterozygosity: {result.heterozygosity * 100:.3f}%")
+        print(f"Repeat Fraction: {result.repeat_fraction * 100:.2f}%")
+        print(f"Read Error Rate: {result.error_rate * 100:.3f}%")
+        print(f"Model Fit: {result.model_fit * 100:.2f}%")
 
-    dataset = [entry.strip().split(" ") for entry in data]
-    main(dataset)
\ No newline at end of file
+def main(coverage, frequency, width=WINDOW, fit=False, k=KMER_SIZE, plot_file=None, show=False):
+    result = estimate(coverage, frequency, width, fit, k)
+    report(result)
+    if plot_file:
+        start, end = result.start, result.end
+        make_plot(coverage[start:end], frequency[start:end], result.coverage_peak, plot_file, show)
+    return result
+
+# ---- RESULT CACHE ----
+
+# Results are kept in a small SQLite store shared by every run on this machine
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "genome_estimate", "results.sqlite")
+CACHE_MAX_ENTRIES = 1000
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Bump whenever a change to the estimator alters its results, so older entries stop matching
+CACHE_VERSION = 1
+
+class ResultCache:
+    # Two-level lookup: (path, size, mtime) -> content hash, so unchanged files are never re-read,
+    # then (content hash, parameters) -> result, so a copied or touched histo still hits
+
+    def __init__(self, path=CACHE_FILE, max_entries=CACHE_MAX_ENTRIES, max_age=CACHE_MAX_AGE):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT);
+            CREATE TABLE IF NOT EXISTS results (
+                digest TEXT, params TEXT, result TEXT, created REAL, accessed REAL,
+                PRIMARY KEY (digest, params));
+        """)
+
+    def close(self):
+        self.db.close()
+
+    def digest(self, path):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        row = self.db.execute("SELECT digest FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                              (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row:
+            return row[0]
+        sha = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(CHUNK_SIZE), b""):
+                sha.update(block)
+        digest = f"{sha.hexdigest()}:{stat.st_size}"
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                            (path, stat.st_size, stat.st_mtime_ns, digest))
+        return digest
+
+    @staticmethod
+    def _params(params):
+        return json.dumps(dict(params, version=CACHE_VERSION), sort_keys=True)
+
+    def get(self, path, params):
+        key = (self.digest(path), self._params(params))
+        row = self.db.execute("SELECT result FROM results WHERE digest = ? AND params = ? AND created >= ?",
+                              key + (time.time() - self.max_age,)).fetchone()
+        if row is None:
+            return None
+        with self.db:
+            self.db.execute("UPDATE results SET accessed = ? WHERE digest = ? AND params = ?", (time.time(),) + key)
+        return Estimate.from_dict(json.loads(row[0]))
+
+    def put(self, path, params, result):
+        now = time.time()
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                            (self.digest(path), self._params(params), json.dumps(result.to_dict()), now, now))
+        self.evict()
+
+    def evict(self):
+        # Drop entries older than max_age, then the least recently used ones beyond max_entries
+        with self.db:
+            self.db.execute("DELETE FROM results WHERE created < ?", (time.time() - self.max_age,))
+            self.db.execute("""
+                DELETE FROM results WHERE rowid NOT IN (
+                    SELECT rowid FROM results ORDER BY accessed DESC LIMIT ?)""", (self.max_entries,))
+            self.db.execute("DELETE FROM files WHERE digest NOT IN (SELECT digest FROM results)")
+
+# ---- MULTI-K BATCH MODE ----
+
+TABLE_COLUMNS = ["k", "start", "end", "coverage_peak", "genome_size", "histo"]
+FIT_COLUMNS = ["model_genome_size", "heterozygosity", "repeat_fraction", "error_rate", "kmer_coverage", "model_fit"]
+
+def find_histos(patterns):
+    # Every pattern may be a .histo file, a directory searched recursively for *.histo, or a glob
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(glob.glob(os.path.join(pattern, "**", "*.histo"), recursive=True))
+        elif os.path.isfile(pattern):
+            paths.append(pattern)
+        else:
+            paths.extend(glob.glob(pattern, recursive=True))
+    return sorted(set(paths), key=lambda path: (kmer_size(path) or 0, path))
+
+def kmer_size(path):
+    # Jellyfish outputs in the logbook are named like k_21_mer_counts.histo
+    match = re.search(r"k_?(\d+)", os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+def estimate_histo(path, width=WINDOW, fit=False, result=None):
+    # A cached result only needs the histogram again for the trimmed curve of the overlay plot
+    coverage, frequency = load_histo(path)
+    if result is None:
+        result = estimate(coverage, frequency, width, fit, kmer_size(path) or KMER_SIZE)
+    result.k, result.histo = kmer_size(path), path
+    return result, coverage[result.start:result.end], frequency[result.start:result.end]
+
+def genome_size_spread(results):
+    sizes = np.array([result.genome_size for result in results], dtype=np.float64)
+    mean = sizes.mean()
+    sd = sizes.std(ddof=1) if sizes.size > 1 else 0.0
+    return {"min": int(sizes.min()), "max": int(sizes.max()), "mean": int(mean), "sd": int(sd), "cv": sd / mean * 100 if mean else 0.0}
+
+def write_table(results, table_file, columns=TABLE_COLUMNS):
+    with open(table_file, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns, delimiter="\t", extrasaction="ignore", restval="")
+        writer.writeheader()
+        writer.writerows(result.to_dict() for result in results)
+
+def make_overlay_plot(curves, plot_file, show=False):
+    plt = load_pyplot(show)
+    fig, ax = plt.subplots()
+    for result, coverage, frequency in curves:
+        ax.plot(coverage, frequency, label=f"k={result.k} (peak {result.coverage_peak})")
+    ax.set_xlabel("Coverage")
+    ax.set_ylabel("Frequency")
+    ax.legend()
+    fig.savefig(plot_file)
+    if show:
+        plt.show()
+    plt.close(fig)
+
+def main_batch(patterns, width=WINDOW, processes=None, table_file="multi_k_estimates.tsv", plot_file=None,
+               fit=False, show=False, cache=None):
+    paths = find_histos(patterns)
+    if not paths:
+        raise FileNotFoundError(f"Error: no .histo files match {' '.join(patterns)}.")
+
+    params = [{"width": width, "fit": fit, "k": kmer_size(path) or KMER_SIZE} for path in paths]
+    cached = [cache.get(path, param) if cache else None for path, param in zip(paths, params)]
+
+    # Each histogram that is not cached (or has to be re-read for the plot) gets its own worker process
+    todo = [i for i, result in enumerate(cached) if result is None or plot_file]
+    for path, result in zip(paths, cached):
+        if result:
+            result.k, result.histo = kmer_size(path), path
+    curves = [(result, None, None) if result else None for result in cached]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for i, curve in zip(todo, executor.map(estimate_histo, [paths[i] for i in todo], [width] * len(todo),
+                                               [fit] * len(todo), [cached[i] for i in todo])):
+            curves[i] = curve
+            if cache and cached[i] is None:
+                cache.put(paths[i], params[i], curve[0])
+    results = [result for result, _, _ in curves]
+
+    columns = TABLE_COLUMNS[:-1] + FIT_COLUMNS + TABLE_COLUMNS[-1:] if fit else TABLE_COLUMNS
+    print("\t".join(columns))
+    for result in results:
+        row = result.to_dict()
+        print("\t".join(str(row.get(column, "")) for column in columns))
+
+    spread = genome_size_spread(results)
+    print(f"Genome size across k: min {spread['min']} bp, max {spread['max']} bp, "
+          f"mean {spread['mean']} bp, sd {spread['sd']} bp (CV {spread['cv']:.2f}%)")
+
+    write_table(results, table_file, columns)
+    if plot_file:
+        make_overlay_plot(curves, plot_file, show)
+    return results, spread
+
+def expand_sources(patterns):
+    # "-" (stdin) and existing files are taken as they are, anything else is expanded as a glob
+    sources = []
+    for pattern in patterns:
+        if pattern == "-" or os.path.isfile(pattern):
+            sources.append(pattern)
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"Error: The file '{pattern}' does not exist.")
+            sources.extend(matches)
+    return sources
+
+def main_file(source, width=WINDOW, fit=False, k=None, plot_file=None, show=False, cache=None):
+    # stdin and piped .jf databases have no stable file to key a cached result on
+    k = k or kmer_size(source) or KMER_SIZE
+    cacheable = cache is not None and os.path.isfile(source) and not source.endswith(".jf")
+    params = {"width": width, "fit": fit, "k": k}
+    result = cache.get(source, params) if cacheable else None
+    if result is None or plot_file:
+        coverage, frequency = load_histo(source)
+        result = main(coverage, frequency, width, fit, k, plot_file, show)
+        if cacheable:
+            cache.put(source, params, result)
+    else:
+        report(result)
+    return result
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate the haploid genome size from a Jellyfish k-mer histogram")
+    parser.add_argument("sources", nargs="*", default=[histo_file], metavar="source",
+                        help=".histo files or globs, .jf databases piped through 'jellyfish histo', or '-' for stdin")
+    parser.add_argument("--width", type=int, default=WINDOW, help="rows that must rise/fall to mark the trough/tail")
+    parser.add_argument("--fit", action="store_true",
+                        help="also fit the negative binomial mixture (heterozygosity, repeats, error rate)")
+    parser.add_argument("-k", type=int, default=None,
+                        help=f"k-mer size of the histogram, used by --fit (default: from the file name, else {KMER_SIZE})")
+    parser.add_argument("--batch", nargs="+", metavar="DIR_OR_GLOB",
+                        help="estimate every matching .histo (e.g. all k_*_mer_counts.histo) in parallel")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes for --batch")
+    parser.add_argument("--table", default="multi_k_estimates.tsv", help="comparison table written by --batch")
+    parser.add_argument("--plot", default=None, metavar="PNG",
+                        help="save the trimmed spectrum (overlaid spectra with --batch) to this file")
+    parser.add_argument("--show", action="store_true", help="also open the plot in a window")
+    parser.add_argument("--cache-file", default=CACHE_FILE, help="SQLite store of previous results")
+    parser.add_argument("--no-cache", action="store_true", help="always re-estimate, ignoring the result cache")
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else ResultCache(args.cache_file)
+    try:
+        if args.batch:
+            return main_batch(args.batch, args.width, args.processes, args.table, args.plot, args.fit, args.show, cache)[0]
+        sources = expand_sources(args.sources)
+        if args.plot and len(sources) > 1:
+            parser.error("--plot takes a single source, use --batch to overlay several spectra")
+        results = []
+        for source in sources:
+            if len(sources) > 1:
+                print(f"==> {source} <==")
+            results.append(main_file(source, args.width, args.fit, args.k, args.plot, args.show, cache))
+        return results
+    finally:
+        if cache:
+            cache.close()
+
+if __name__ == "__main__":
+    cli()
@@ -1,80 +1,23 @@
 import sys
-import matplotlib.pyplot as plt
 
+# Kept for existing scripts: the estimator now lives in genome_estimate.py
+from genome_estimate import (detect_bounds, estimate, estimate_coverage_peak, estimate_genome_size, load_histo,
+                             make_plot, report)
 
-def make_plot(coverage, frequency, cov_peak):
-    plt.plot(coverage, frequency)
-    plt.xlabel("Coverage")
-    plt.ylabel("Frequency")
-    plt.axvline(x=cov_peak, color='r')
-    plt.savefig("genome.png")
 
-
-def detect_start(frequency):
-    start = 0
-    for idx in range(len(frequency)):
-        test_list = frequency[idx:idx + 10]
-        if all(i < j for i, j in zip(test_list, test_list[1:])):
-            start = idx
-            break
-    print(f"start at: {start}")
-    return start
-
-
-def detect_end(frequency):
-    end = -1
-    for idx in range(len(frequency), -1, -1):
-        test_list = frequency[idx - 10:idx]
-        if all(i > j for i, j in zip(test_list, test_list[1:])):
-            end = idx
-            break
-    print(f"end at: {end}")
-    return end
-
-
-def estimate_coverage_peak(coverage, frequency):
-    higher_freq = max(frequency)
-    coverage_peak = coverage[frequency.index(higher_freq)]
-    print(f"Coverage peak: {coverage_peak}")
-    return coverage_peak
-
-
-def estimate_genome_size(coverage, frequency, coverage_peak):
-    area_under_the_curve = sum([c * f for c, f in zip(coverage, frequency)])
-    genome_size = int(area_under_the_curve / coverage_peak)
-    print(f"genome size: {genome_size}")
-
-
-def main(dataset):
-    coverage = [int(entry[0]) for entry in dataset]
-    frequency = [int(entry[1]) for entry in dataset]
-
-    start = detect_start(frequency)
-    end = detect_end(frequency)
-
-    coverage = coverage[start:end]
-    frequency = frequency[start:end]
-
-    coverage_peak = estimate_coverage_peak(coverage, frequency)
-    estimate_genome_size(coverage, frequency, coverage_peak)
-
-    make_plot(coverage, frequency, coverage_peak)
+def main(coverage, frequency, plot_file=None):
+    # The trimmed spectrum is only plotted when the caller names a file for it
+    result = estimate(coverage, frequency)
+    report(result)
+    if plot_file:
+        make_plot(coverage[result.start:result.end], frequency[result.start:result.end], result.coverage_peak,
+                  plot_file)
+    return result
 
 
 if __name__ == "__main__":
+    # python3 genome_sys.py <histo> [plot file]
     file_name = sys.argv[1]
-    with open(filename) as fh:
-        data = fh.readlines()
-
-        dataset = [entry.strip().split(" ") for entry in data]
-        main(dataset)
-
-
-
-
-
-
-
-
-
-
+    plot_file = sys.argv[2] if len(sys.argv) > 2 else None
+    coverage, frequency = load_histo(file_name)
+    main(coverage, frequency, plot_file)
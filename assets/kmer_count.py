@@ -0,0 +1,312 @@
+import argparse
+import gzip
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from genome_estimate import WINDOW, detect_bounds, estimate_coverage_peak, estimate_genome_size
+
+# 2-bit code of every base: A=0, C=1, G=2, T=3, anything else (N, IUPAC) is invalid
+INVALID = 4
+CODES = np.full(256, INVALID, dtype=np.uint8)
+for base, code in zip(b"ACGTacgt", [0, 1, 2, 3, 0, 1, 2, 3]):
+    CODES[base] = code
+
+# Bases handed to a worker per task (reads are joined with an N so no k-mer spans two reads)
+BATCH_BASES = 1 << 22
+
+# Bytes of decompressed FASTQ read at a time
+READ_SIZE = 1 << 22
+
+# Number of hash partitions the k-mers are spilled into before the final per-shard count
+SHARDS = 64
+
+# Same default as `jellyfish histo --high`: every count above it lands in the last bin
+HIGH = 10000
+
+def open_reads(path):
+    if path == "-":
+        return sys.stdin.buffer
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+def _file_batches(path, batch_bases, read_step=1):
+    # Read the decompressed FASTQ in large blocks and pick out every 4th line (the sequence)
+    # with bytes.split, instead of iterating over the file line by line; with read_step > 1
+    # only every read_step-th read is kept
+    fh = open_reads(path)
+    batch, size, carry, phase, reads = [], 0, b"", 0, 0
+    try:
+        while True:
+            block = fh.read(READ_SIZE)
+            lines = (carry + block).split(b"\n")
+            carry = lines.pop() if block else b""
+            sequences = lines[(1 - phase) % 4::4]
+            phase = (phase + len(lines)) % 4
+            if read_step > 1:
+                kept = sequences[-reads % read_step::read_step]
+                reads += len(sequences)
+                sequences = kept
+            batch.extend(sequences)
+            size += sum(map(len, sequences)) + len(sequences)
+            if size >= batch_bases or (not block and batch):
+                yield b"N".join(batch)
+                batch, size = [], 0
+            if not block:
+                break
+    finally:
+        if fh is not sys.stdin.buffer:
+            fh.close()
+
+def read_batches(paths, batch_bases=BATCH_BASES, read_step=1):
+    # Every input file is decompressed by its own thread (zlib releases the GIL); batches are
+    # yielded in whatever order they become ready
+    ready = queue.Queue(maxsize=2 * len(paths))
+    done = object()
+
+    def reader(path):
+        try:
+            for batch in _file_batches(path, batch_bases, read_step):
+                ready.put(batch)
+        except BaseException as error:
+            ready.put(error)
+        finally:
+            ready.put(done)
+
+    threads = [threading.Thread(target=reader, args=(path,), daemon=True) for path in paths]
+    for thread in threads:
+        thread.start()
+    running = len(threads)
+    while running:
+        batch = ready.get()
+        if batch is done:
+            running -= 1
+        elif isinstance(batch, BaseException):
+            raise batch
+        else:
+            yield batch
+
+def mix64(kmers):
+    # MurmurHash3 finalizer, spreads packed k-mers evenly over the 64-bit range
+    kmers = kmers ^ (kmers >> np.uint64(33))
+    kmers = kmers * np.uint64(0xFF51AFD7ED558CCD)
+    kmers = kmers ^ (kmers >> np.uint64(33))
+    kmers = kmers * np.uint64(0xC4CEB9FE1A85EC53)
+    return kmers ^ (kmers >> np.uint64(33))
+
+def reverse_complement(kmers, k):
+    # Complement is XOR 3 on every 2-bit base; reverse the base order by swapping 2-bit pairs,
+    # then nibbles, then bytes, and shift the k bases back down to the low bits
+    kmers = ~kmers
+    kmers = ((kmers >> np.uint64(2)) & np.uint64(0x3333333333333333)) | ((kmers & np.uint64(0x3333333333333333)) << np.uint64(2))
+    kmers = ((kmers >> np.uint64(4)) & np.uint64(0x0F0F0F0F0F0F0F0F)) | ((kmers & np.uint64(0x0F0F0F0F0F0F0F0F)) << np.uint64(4))
+    return kmers.byteswap() >> np.uint64(64 - 2 * k)
+
+def canonical_kmers(sequence, k):
+    # 2-bit pack every k-mer of the batch and keep the smaller of it and its reverse complement
+    codes = CODES[np.frombuffer(sequence, dtype=np.uint8)]
+    n = codes.size - k + 1
+    if n <= 0:
+        return np.empty(0, dtype=np.uint64)
+    invalid = codes == INVALID
+
+    # Build the packed k-mers by doubling (1, 2, 4, ... base blocks) so a k-mer takes
+    # log2(k) array passes instead of k
+    block = np.where(invalid, 0, codes).astype(np.uint64)
+    forward = np.zeros(n, dtype=np.uint64)
+    size, length, remaining = 1, 0, k
+    while True:
+        if remaining & 1:
+            forward <<= np.uint64(2 * size)
+            forward |= block[length:length + n]
+            length += size
+        remaining >>= 1
+        if not remaining:
+            break
+        block = (block[:-size] << np.uint64(2 * size)) | block[size:]
+        size *= 2
+
+    # Drop every k-mer that overlaps an N or a read boundary
+    bad = np.concatenate(([0], np.cumsum(invalid, dtype=np.int64)))
+    keep = bad[k:] == bad[:n]
+    forward = forward[keep]
+    return np.minimum(forward, reverse_complement(forward, k))
+
+def spill_batch(sequence, k, shards, spill_dir, batch_id, fraction=1.0):
+    # Count the k-mers of one batch and write the partial counts of each shard to disk
+    kmers = canonical_kmers(sequence, k)
+    if fraction < 1.0:
+        # Keep a fixed hash range of k-mers: a sampled k-mer keeps every one of its occurrences,
+        # so the counts (and the coverage axis) are unbiased and only the frequencies shrink
+        kmers = kmers[mix64(kmers) < np.uint64(int(fraction * 2 ** 64))]
+    kmers, counts = np.unique(kmers, return_counts=True)
+    shard_of = (mix64(kmers) % np.uint64(shards)).astype(np.int64)
+    order = np.argsort(shard_of, kind="stable")
+    bounds = np.searchsorted(shard_of[order], np.arange(shards + 1))
+    for shard in range(shards):
+        part = order[bounds[shard]:bounds[shard + 1]]
+        if part.size:
+            np.save(os.path.join(spill_dir, f"shard_{shard}_{batch_id}.npy"),
+                    np.stack([kmers[part], counts[part].astype(np.uint64)]))
+    return kmers.size
+
+def count_shard(spill_dir, shard, high=HIGH):
+    # Merge the partial counts of one shard and turn them into a count histogram
+    prefix = f"shard_{shard}_"
+    parts = [np.load(os.path.join(spill_dir, name)) for name in os.listdir(spill_dir) if name.startswith(prefix)]
+    if not parts:
+        return np.zeros(high + 1, dtype=np.int64)
+    merged = np.concatenate(parts, axis=1)
+    order = np.argsort(merged[0], kind="stable")
+    kmers, counts = merged[0][order], merged[1][order]
+    firsts = np.flatnonzero(np.concatenate(([True], kmers[1:] != kmers[:-1])))
+    totals = np.add.reduceat(counts, firsts)
+    return np.bincount(np.minimum(totals, high).astype(np.int64), minlength=high + 1)
+
+def count_kmers(paths, k=21, processes=None, shards=SHARDS, high=HIGH, tmp_dir=None, batch_bases=BATCH_BASES,
+                fraction=1.0, read_step=1):
+    # Return the k-mer count histogram (index = count, value = number of distinct k-mers)
+    if not 1 <= k <= 32:
+        raise ValueError("Error: k must be between 1 and 32 to fit a 2-bit packed 64-bit k-mer.")
+    spill_dir = tempfile.mkdtemp(prefix="kmer_count_", dir=tmp_dir)
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            # Bound the batches in flight so the reader never runs far ahead of the workers
+            limit = 2 * (processes or os.cpu_count() or 1)
+            pending = []
+            for batch_id, sequence in enumerate(read_batches(paths, batch_bases, read_step)):
+                pending.append(executor.submit(spill_batch, sequence, k, shards, spill_dir, batch_id, fraction))
+                if len(pending) >= limit:
+                    pending.pop(0).result()
+            for future in pending:
+                future.result()
+
+            histogram = np.zeros(high + 1, dtype=np.int64)
+            for shard_histogram in executor.map(count_shard, [spill_dir] * shards, range(shards), [high] * shards):
+                histogram += shard_histogram
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    return histogram
+
+def write_histo(histogram, fh, full=False):
+    # Same two-column "count frequency" layout as `jellyfish histo` (zero rows skipped unless full)
+    for count in range(1, histogram.size):
+        if histogram[count] or full:
+            fh.write(f"{count} {histogram[count]}\n")
+
+# ---- PREVIEW MODE ----
+
+# Share of the k-mer hash space counted by default in preview mode
+PREVIEW_FRACTION = 0.01
+
+# Bootstrap replicates behind the preview confidence interval
+BOOTSTRAP = 500
+
+# Rows of the moving average applied to the sampled spectrum before it is trimmed
+SMOOTH = 5
+
+# Fewer distinct sampled k-mers than this cannot give a usable spectrum
+MIN_SAMPLED_KMERS = 1000
+
+def smooth_spectrum(frequency, bins=SMOOTH):
+    # Centred moving average over the last axis (edges padded with their own value, so the
+    # error peak at coverage 1 is not pulled down); sparse sampled bins are Poisson noise that
+    # otherwise breaks the strictly monotonic runs detect_bounds looks for
+    frequency = np.asarray(frequency, dtype=np.float64)
+    if bins <= 1:
+        return frequency
+    half = bins // 2
+    padding = [(0, 0)] * (frequency.ndim - 1) + [(half, bins - 1 - half)]
+    sums = np.cumsum(np.pad(frequency, padding, mode="edge"), axis=-1)
+    sums = np.concatenate([np.zeros(sums.shape[:-1] + (1,)), sums], axis=-1)
+    return (sums[..., bins:] - sums[..., :-bins]) / bins
+
+def preview(paths, k=21, fraction=PREVIEW_FRACTION, read_step=1, width=WINDOW, smooth=SMOOTH, processes=None,
+            shards=SHARDS, high=HIGH, tmp_dir=None):
+    # Estimate the genome size from a hash sample of the k-mers (and optionally every
+    # read_step-th read), then scale the estimate back up to the full library
+    histogram = count_kmers(paths, k, processes, shards, high, tmp_dir, fraction=fraction, read_step=read_step)
+    sampled_kmers = int(histogram.sum())
+    if sampled_kmers < MIN_SAMPLED_KMERS:
+        raise ValueError(f"Error: only {sampled_kmers} distinct k-mers were sampled (at least {MIN_SAMPLED_KMERS} "
+                         f"are needed), increase --sample.")
+
+    # Hash sampling keeps the count of every sampled k-mer, so the spectrum keeps its shape but its
+    # bins get sparse: trim on the smoothed, gap-free spectrum (coverage 1 .. high)
+    coverage = np.arange(1, histogram.size)
+    frequency = histogram[1:]
+    smoothed = smooth_spectrum(frequency, smooth)
+    start, end = detect_bounds(smoothed, width)
+    if end < 0 or end - start < 2:
+        raise ValueError(f"Error: no error trough and coverage peak found in the sampled spectrum "
+                         f"(start {start}, end {end}), increase --sample or lower --width.")
+    trimmed_coverage, trimmed_frequency = coverage[start:end], frequency[start:end]
+    coverage_peak = estimate_coverage_peak(trimmed_coverage, smoothed[start:end])
+    genome_size = estimate_genome_size(trimmed_coverage, trimmed_frequency, coverage_peak) / fraction
+
+    # Every bin of the sampled spectrum is a Poisson count, so resample the bins to get a
+    # confidence interval that covers the noise in both the area and the modal coverage
+    replicates = np.random.default_rng(0).poisson(trimmed_frequency, size=(BOOTSTRAP, trimmed_frequency.size))
+    peaks = trimmed_coverage[smooth_spectrum(replicates, smooth).argmax(axis=1)]
+    sizes = replicates @ trimmed_coverage / peaks / fraction
+    ci_low, ci_high = np.percentile(sizes, [2.5, 97.5])
+
+    return {
+        "start": start,
+        "end": end,
+        "coverage_peak": coverage_peak * read_step,
+        "genome_size": int(genome_size),
+        "ci_low": int(ci_low),
+        "ci_high": int(ci_high),
+        "sampled_kmers": sampled_kmers,
+        "fraction": fraction,
+        "read_step": read_step,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count canonical k-mers in FASTQ(.gz) reads and write a Jellyfish-style .histo")
+    parser.add_argument("reads", nargs="+", help="FASTQ or FASTQ.gz files ('-' for stdin)")
+    parser.add_argument("-m", "--mer-len", type=int, default=21, help="k-mer length (at most 32)")
+    parser.add_argument("-t", "--threads", type=int, default=None, help="worker processes")
+    parser.add_argument("-o", "--output", default="-", help="output .histo file (default: stdout)")
+    parser.add_argument("--high", type=int, default=HIGH, help="largest count bin, higher counts are added to it")
+    parser.add_argument("--full", action="store_true", help="also write the bins with no k-mers")
+    parser.add_argument("--shards", type=int, default=SHARDS, help="hash partitions spilled to disk")
+    parser.add_argument("--tmp-dir", default=None, help="directory for the spilled partitions")
+    parser.add_argument("--preview", action="store_true",
+                        help="print a sampled genome size estimate with a 95%% confidence interval instead of a .histo")
+    parser.add_argument("--sample", type=float, default=PREVIEW_FRACTION,
+                        help="share of the k-mer hash space counted by --preview")
+    parser.add_argument("--read-step", type=int, default=1, help="--preview only reads every n-th read")
+    parser.add_argument("--width", type=int, default=WINDOW,
+                        help="--preview: rows of the rising / falling runs that bound the trimmed spectrum")
+    parser.add_argument("--smooth", type=int, default=SMOOTH,
+                        help="--preview: rows of the moving average applied before trimming (1: none)")
+    args = parser.parse_args()
+
+    if args.preview:
+        try:
+            result = preview(args.reads, args.mer_len, args.sample, args.read_step, args.width, args.smooth,
+                             args.threads, args.shards, args.high, args.tmp_dir)
+        except ValueError as error:
+            sys.exit(str(error))
+        print(f"Sampled k-mers: {result['sampled_kmers']} ({result['fraction'] * 100:g}% of the hash space, "
+              f"every {result['read_step']} read(s))")
+        print(f"Coverage Peak: {result['coverage_peak']}")
+        print(f"Estimated Genome Size: {result['genome_size']} bp "
+              f"(95% CI {result['ci_low']} - {result['ci_high']} bp)")
+        sys.exit(0)
+
+    histogram = count_kmers(args.reads, args.mer_len, args.threads, args.shards, args.high, args.tmp_dir)
+    if args.output == "-":
+        write_histo(histogram, sys.stdout, args.full)
+    else:
+        with open(args.output, "w") as out:
+            write_histo(histogram, out, args.full)
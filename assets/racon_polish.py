@@ -0,0 +1,189 @@
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Specify the exact paths used on the lab server
+reads_file = "/media/raid/Wee/WeeYeZhi/resources_from_LKM/raw_pacbio_read/PacBio.fq"
+initial_assembly = "/media/raid/Wee/WeeYeZhi/output/MaSuRCA_results/MaSuRCA_raw_assembly_latestmodifiedPE_gapclosing_trimmedadapter_results/CA.mr.67.17.15.0.02/primary.genome.scf.fasta"
+work_dir = "/media/raid/Wee/WeeYeZhi/output/racon_results/racon_polishing"
+
+CHECKPOINT = "checkpoint.json"
+
+# ---- CHECKPOINTS ----
+
+def sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def fingerprint(path):
+    # The reads are tens of GB and never rewritten, so size + mtime stands in for their content hash
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+def load_checkpoint(work_dir):
+    path = os.path.join(work_dir, CHECKPOINT)
+    if not os.path.exists(path):
+        return {"rounds": []}
+    with open(path) as fh:
+        return json.load(fh)
+
+def save_checkpoint(work_dir, checkpoint):
+    # Written to a temporary file first, so an interrupted run never leaves a half-written checkpoint
+    path = os.path.join(work_dir, CHECKPOINT)
+    with open(path + ".tmp", "w") as fh:
+        json.dump(checkpoint, fh, indent=2)
+    os.replace(path + ".tmp", path)
+
+def completed_round(checkpoint, number, input_hash, settings, work_dir):
+    # A round is only reused when it polished the same input with the same settings and its output is intact
+    for entry in checkpoint["rounds"]:
+        if entry["round"] != number or entry["input"] != input_hash or entry["settings"] != settings:
+            continue
+        output = os.path.join(work_dir, entry["file"])
+        if os.path.exists(output) and sha256(output) == entry["output"]:
+            return entry
+    return None
+
+# ---- POLISHING ----
+
+def _pump(stream, log):
+    for line in stream:
+        log.write(line)
+        log.flush()
+
+def _open_fifo(fifo, reader):
+    # Opening a FIFO for writing blocks until the reader opens it, so poll instead of hanging
+    # forever when racon exits (bad arguments, missing reads file) before getting that far
+    while True:
+        try:
+            fd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+            break
+        except OSError:
+            if reader.poll() is not None:
+                raise RuntimeError(f"Error: racon exited with {reader.returncode} before reading the alignments.")
+            time.sleep(0.05)
+    os.set_blocking(fd, True)
+    return open(fd, "w")
+
+def polish_round(reads, assembly, output, threads, minimap2="minimap2", racon="racon", racon_args=(),
+                 preset="map-pb", log=sys.stderr):
+    # minimap2 writes its alignments into a named pipe that racon reads as its .paf overlap file,
+    # so no multi-GB PAF file is ever written to the RAID. Racon's polished contigs go to
+    # <output>.tmp and are only renamed to <output> once both tools exit cleanly
+    procs = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="racon_") as tmp:
+            fifo = os.path.join(tmp, "overlaps.paf")
+            os.mkfifo(fifo)
+            with open(output + ".tmp", "w") as out:
+                racon_proc = subprocess.Popen([racon, "-t", str(threads), *racon_args, reads, fifo, assembly],
+                                              stdout=out, stderr=subprocess.PIPE, text=True)
+                procs.append(racon_proc)
+                pumps = [threading.Thread(target=_pump, args=(racon_proc.stderr, log), daemon=True)]
+                pumps[0].start()
+                with _open_fifo(fifo, racon_proc) as paf:
+                    minimap2_proc = subprocess.Popen([minimap2, "-x", preset, "-t", str(threads), assembly, reads],
+                                                     stdout=paf, stderr=subprocess.PIPE, text=True)
+                procs.append(minimap2_proc)
+                pumps.append(threading.Thread(target=_pump, args=(minimap2_proc.stderr, log), daemon=True))
+                pumps[1].start()
+                minimap2_status = minimap2_proc.wait()
+                racon_status = racon_proc.wait()
+                for pump in pumps:
+                    pump.join()
+            if minimap2_status != 0 or racon_status != 0:
+                raise RuntimeError(f"Error: minimap2 exited with {minimap2_status} and racon with {racon_status} "
+                                   f"while polishing '{assembly}'.")
+    except BaseException:
+        # e.g. minimap2 could not be started: do not leave racon running on the output file
+        for proc in procs:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+        if os.path.exists(output + ".tmp"):
+            os.remove(output + ".tmp")
+        raise
+    os.replace(output + ".tmp", output)
+
+def count_changes(previous, polished, threads, minimap2="minimap2"):
+    # Bases changed by a round: edit distance (NM tag) summed over the asm5 alignments of the
+    # polished contigs against the previous ones, read straight from minimap2's stdout
+    proc = subprocess.Popen([minimap2, "-x", "asm5", "-c", "--secondary=no", "-t", str(threads), previous, polished],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    changes = 0
+    for line in proc.stdout:
+        for tag in line.rstrip("\n").split("\t")[12:]:
+            if tag.startswith("NM:i:"):
+                changes += int(tag[5:])
+                break
+    if proc.wait() != 0:
+        raise RuntimeError(f"Error: minimap2 could not compare '{polished}' with '{previous}'.")
+    return changes
+
+def _changed(changes):
+    # The change count is only measured with --min-changes
+    return "" if changes is None else f" ({changes} bases changed)"
+
+def polish(reads, assembly, work_dir, rounds=4, threads=24, min_changes=0, minimap2="minimap2", racon="racon",
+           racon_args=(), preset="map-pb"):
+    # Runs up to `rounds` minimap2 -> racon rounds in work_dir and returns the last polished assembly.
+    # Rounds found in the checkpoint are skipped, and polishing stops early once a round changes
+    # fewer than `min_changes` bases
+    os.makedirs(work_dir, exist_ok=True)
+    checkpoint = load_checkpoint(work_dir)
+    settings = {"reads": fingerprint(reads), "preset": preset, "racon_args": list(racon_args)}
+    current = assembly
+    current_hash = sha256(assembly)
+    for number in range(1, rounds + 1):
+        entry = completed_round(checkpoint, number, current_hash, settings, work_dir)
+        if entry:
+            print(f"Round {number}: already polished{_changed(entry['changes'])}, skipping.")
+        else:
+            output = os.path.join(work_dir, f"assembly_round{number}.fasta")
+            print(f"Round {number}: aligning reads to {current} and polishing with racon...")
+            started = time.perf_counter()
+            with open(os.path.join(work_dir, f"round{number}.log"), "w") as log:
+                polish_round(reads, current, output, threads, minimap2, racon, racon_args, preset, log)
+            changes = count_changes(current, output, threads, minimap2) if min_changes else None
+            entry = {"round": number, "input": current_hash, "settings": settings, "file": os.path.basename(output),
+                     "output": sha256(output), "changes": changes, "seconds": round(time.perf_counter() - started, 1)}
+            checkpoint["rounds"] = [old for old in checkpoint["rounds"] if old["round"] < number] + [entry]
+            save_checkpoint(work_dir, checkpoint)
+            print(f"Round {number}: completed in {entry['seconds']} s{_changed(changes)}.")
+        current, current_hash = os.path.join(work_dir, entry["file"]), entry["output"]
+        if min_changes and entry["changes"] is not None and entry["changes"] < min_changes:
+            print(f"Round {number} changed fewer than {min_changes} bases, stopping early.")
+            break
+    return current
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resumable iterative long-read polishing with minimap2 and racon")
+    parser.add_argument("--reads", default=reads_file, help="long reads (FASTQ/FASTA) used for polishing")
+    parser.add_argument("--assembly", default=initial_assembly, help="assembly to polish")
+    parser.add_argument("--work-dir", default=work_dir, help="polished assemblies, logs and checkpoint.json")
+    parser.add_argument("--rounds", type=int, default=4, help="maximum number of polishing rounds")
+    parser.add_argument("-t", "--threads", type=int, default=24)
+    parser.add_argument("--min-changes", type=int, default=0,
+                        help="stop once a round changes fewer bases than this (0: always run every round)")
+    parser.add_argument("--preset", default="map-pb", help="minimap2 preset of the reads (map-pb, map-ont, map-hifi)")
+    parser.add_argument("--gpu", action="store_true", help="use racon-gpu's CUDA POA and aligner batches")
+    parser.add_argument("--minimap2", default="minimap2", help="minimap2 executable")
+    parser.add_argument("--racon", default="racon", help="racon executable")
+    args = parser.parse_args()
+
+    racon_args = ["--cudapoa-batches", "1", "--cudaaligner-batches", "1"] if args.gpu else []
+    try:
+        final = polish(args.reads, args.assembly, args.work_dir, args.rounds, args.threads, args.min_changes,
+                       args.minimap2, args.racon, racon_args, args.preset)
+    except (OSError, RuntimeError) as error:
+        sys.exit(str(error))
+    print(f"Final polished assembly: {final}")
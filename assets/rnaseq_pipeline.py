@@ -0,0 +1,293 @@
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+# Specify the exact paths used on the lab server
+fastq_dir = "/home/cbr16/Documents/WeeYeZhi/input"
+output_dir = "/home/cbr16/Documents/WeeYeZhi/output/pipeline"
+genome_dir = "/home/cbr16/Documents/WeeYeZhi/output/GenomeIndexresults/GenomeIndex"
+annotation_file = "/home/cbr16/Documents/WeeYeZhi/output/GenomeIndexresults/GenomeIndex/CPB_insect_draft_assembly.v4.gtf"
+
+# Order of the pipeline steps of every sample
+STEPS = ["fastp", "falco", "star", "featurecounts"]
+
+# Threads each step can make use of (min, max) and the memory one job needs, in GB
+RESOURCES = {
+    "fastp": (2, 16, 4),
+    "falco": (1, 2, 2),
+    "star": (4, 16, 32),
+    "featurecounts": (1, 8, 4),
+}
+
+# ---- SAMPLE SHEET ----
+
+def read_sample_sheet(path, fastq_dir=fastq_dir):
+    # targets.txt layout (sampleID and developmental_stage, tab or space separated), optionally extended
+    # with read1/read2 columns; reads default to <fastq_dir>/<sampleID>_1.fastq.gz and _2.fastq.gz
+    with open(path) as fh:
+        rows = [line.split() for line in fh if line.strip() and not line.startswith("#")]
+    if not rows or rows[0][0] != "sampleID":
+        raise ValueError(f"Error: '{path}' does not start with a sampleID header.")
+    header, rows = rows[0], rows[1:]
+    samples = []
+    for row in rows:
+        sample = dict(zip(header, row))
+        sample.setdefault("read1", os.path.join(fastq_dir, f"{sample['sampleID']}_1.fastq.gz"))
+        sample.setdefault("read2", os.path.join(fastq_dir, f"{sample['sampleID']}_2.fastq.gz"))
+        samples.append(sample)
+    return samples
+
+# ---- TASK GRAPH ----
+
+@dataclass(slots=True)
+class Task:
+    name: str
+    sample: str
+    step: str
+    commands: object  # callable(threads) -> list of argv lists, run one after another
+    outputs: list
+    deps: list = field(default_factory=list)
+    min_threads: int = 1
+    max_threads: int = 1
+    memory: float = 1.0
+    status: str = "pending"
+    returncode: int | None = None
+    threads: int = 0
+    seconds: float = 0.0
+
+def build_tasks(samples, output_dir=output_dir, genome_dir=genome_dir, annotation_file=annotation_file,
+                resources=RESOURCES):
+    # Per sample: fastp -> falco (QC of the trimmed reads) and fastp -> STAR -> featureCounts,
+    # so falco of one sample overlaps with the alignment of the same or other samples
+    dirs = {step: os.path.join(output_dir, step) for step in STEPS}
+    tasks = {}
+
+    def add(sample, step, commands, outputs, deps):
+        low, high, memory = resources[step]
+        task = Task(f"{step}:{sample}", sample, step, commands, outputs, deps, low, high, memory)
+        tasks[task.name] = task
+
+    for entry in samples:
+        sample = entry["sampleID"]
+        trimmed = [os.path.join(dirs["fastp"], f"{sample}_{i}.fastq.gz") for i in (1, 2)]
+        html, report = (os.path.join(dirs["fastp"], f"{sample}_report.{ext}") for ext in ("html", "json"))
+        add(sample, "fastp", lambda t, r1=entry["read1"], r2=entry["read2"], o=trimmed, h=html, j=report: [[
+            "fastp", "-i", r1, "-I", r2, "-o", o[0], "-O", o[1], "-n", "2", "-f", "15", "-q", "20", "-l", "70",
+            "--correction", "--detect_adapter_for_pe", "--html", h, "--json", j, "-w", str(t)]],
+            trimmed + [report], [])
+
+        falco_outputs = []
+        for read in trimmed:
+            base = os.path.join(dirs["falco"], os.path.basename(read)[:-len(".fastq.gz")])
+            falco_outputs.append(f"{base}_fastqc_data.txt")
+        add(sample, "falco", lambda t, reads=trimmed, d=dirs["falco"]: [[
+            "falco", read, "-o", d,
+            "-D", os.path.join(d, os.path.basename(read)[:-len(".fastq.gz")] + "_fastqc_data.txt"),
+            "-R", os.path.join(d, os.path.basename(read)[:-len(".fastq.gz")] + "_fastqc_report.html"),
+            "-S", os.path.join(d, os.path.basename(read)[:-len(".fastq.gz")] + "_summary.txt")] for read in reads],
+            falco_outputs, [f"fastp:{sample}"])
+
+        prefix = os.path.join(dirs["star"], f"{sample}_")
+        bam = f"{prefix}Aligned.sortedByCoord.out.bam"
+        add(sample, "star", lambda t, reads=trimmed, p=prefix: [[
+            "STAR", "--runMode", "alignReads", "--runThreadN", str(t), "--genomeDir", genome_dir,
+            "--readFilesIn", *reads, "--readFilesCommand", "zcat", "--outFileNamePrefix", p,
+            "--outSAMtype", "BAM", "SortedByCoordinate", "--outSAMunmapped", "Within",
+            "--outSAMattributes", "Standard", "--twopassMode", "Basic", "--outTmpDir", f"{p}tmp"]],
+            [bam], [f"fastp:{sample}"])
+
+        # One count table per sample, in the layout deseq2.Rmd reads (counts in column 7). deseq2.Rmd
+        # expects <sampleID>.markdup.featurecount, counted on duplicate-marked BAMs; these tables are
+        # counted on STAR's BAM as is, so copy them under that name only if that is what you want
+        counts = os.path.join(dirs["featurecounts"], f"{sample}.featurecount")
+        add(sample, "featurecounts", lambda t, b=bam, o=counts: [[
+            "featureCounts", "-T", str(t), "-p", "-t", "exon", "-g", "gene_id", "-F", "GTF",
+            "-a", annotation_file, "-o", o, b]],
+            [counts], [f"star:{sample}"])
+    return tasks
+
+def stub_commands(task, delay=0.1, fail=()):
+    # Stand-in for the real tools: sleep, then create the task's outputs (or exit 1 if the task
+    # is listed in `fail`), so the scheduler can be exercised on any machine
+    if task.name in fail or task.step in fail:
+        return lambda threads: [[sys.executable, "-c", f"import time; time.sleep({delay}); raise SystemExit(1)"]]
+    script = ("import pathlib, sys, time; time.sleep(float(sys.argv[1])); "
+              "[pathlib.Path(p).touch() for p in sys.argv[2:]]")
+    return lambda threads: [[sys.executable, "-c", script, str(delay), *task.outputs]]
+
+# ---- SCHEDULER ----
+
+def total_memory():
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2 ** 30
+
+def _critical_path(tasks):
+    # Number of tasks still to run after (and including) each task, used as its priority
+    children = {name: [] for name in tasks}
+    for task in tasks.values():
+        for dep in task.deps:
+            children[dep].append(task.name)
+    depth = {}
+
+    def visit(name):
+        if name not in depth:
+            depth[name] = 1 + max((visit(child) for child in children[name]), default=0)
+        return depth[name]
+
+    for name in tasks:
+        visit(name)
+    return depth
+
+def _marker(task, log_dir):
+    return os.path.join(log_dir, f"{task.step}_{task.sample}.done")
+
+def _completed(task, log_dir):
+    # Outputs alone do not prove a task finished (a STAR job killed while sorting leaves a truncated
+    # BAM), so a task only counts as done once it has written its success marker
+    return (bool(task.outputs) and os.path.exists(_marker(task, log_dir))
+            and all(os.path.exists(path) for path in task.outputs))
+
+def _run_task(task, log_dir):
+    # Commands run one after another with their output in <log_dir>/<step>_<sample>.log; the
+    # success marker <log_dir>/<step>_<sample>.done is only written once all of them exit with 0
+    log_file = os.path.join(log_dir, f"{task.step}_{task.sample}.log")
+    marker = _marker(task, log_dir)
+    if os.path.exists(marker):
+        os.remove(marker)
+    started = time.perf_counter()
+    with open(log_file, "w") as log:
+        returncode = 0
+        for command in task.commands(task.threads):
+            log.write("$ " + " ".join(command) + "\n")
+            log.flush()
+            try:
+                returncode = subprocess.run(command, stdout=log, stderr=subprocess.STDOUT).returncode
+            except FileNotFoundError:
+                log.write(f"Error: '{command[0]}' is not installed or not on PATH.\n")
+                returncode = 127
+            if returncode != 0:
+                break
+    task.seconds = time.perf_counter() - started
+    if returncode == 0:
+        with open(marker, "w") as fh:
+            fh.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')}\t{task.seconds:.1f} s\n")
+    return returncode
+
+def run_pipeline(tasks, cores=None, memory=None, log_dir="logs", force=False, dry_run=False):
+    # Start every task whose dependencies succeeded as soon as enough cores and memory are free.
+    # A task gets an even share of the free cores among the ready tasks, within its (min, max)
+    # thread range, and longer remaining chains start first
+    cores = cores or os.cpu_count()
+    memory = memory or total_memory()
+    for task in tasks.values():
+        if task.min_threads > cores or task.memory > memory:
+            raise ValueError(f"Error: {task.name} needs {task.min_threads} cores and {task.memory} GB, "
+                             f"more than the budget of {cores} cores and {memory:.0f} GB.")
+    priority = _critical_path(tasks)
+    if not dry_run:
+        os.makedirs(log_dir, exist_ok=True)
+        for task in tasks.values():
+            for path in task.outputs:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    free_cores, free_memory = cores, memory
+    running = {}
+    with ThreadPoolExecutor(max_workers=cores) as executor:
+        while True:
+            for task in tasks.values():
+                if task.status == "pending" and any(tasks[dep].status in ("failed", "skipped") for dep in task.deps):
+                    task.status = "skipped"
+            ready = sorted((task for task in tasks.values() if task.status == "pending"
+                            and all(tasks[dep].status in ("done", "cached") for dep in task.deps)),
+                           key=lambda task: (-priority[task.name], STEPS.index(task.step), task.sample))
+            cached = False
+            for i, task in enumerate(ready):
+                if not force and _completed(task, log_dir):
+                    task.status = cached = "cached"
+                    continue
+                share = free_cores // max(1, len(ready) - i)
+                threads = min(task.max_threads, max(task.min_threads, share), free_cores)
+                if threads < task.min_threads or task.memory > free_memory:
+                    continue
+                task.threads = threads
+                task.status = "running"
+                free_cores -= threads
+                free_memory -= task.memory
+                print(f"[{time.strftime('%H:%M:%S')}] start {task.name} ({threads} threads, {task.memory:g} GB)")
+                if dry_run:
+                    for command in task.commands(threads):
+                        print("    " + " ".join(command))
+                    future = executor.submit(lambda: 0)
+                else:
+                    future = executor.submit(_run_task, task, log_dir)
+                running[future] = task
+            if cached:
+                # Completed by an earlier run: their dependents may be ready now
+                continue
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                task = running.pop(future)
+                free_cores += task.threads
+                free_memory += task.memory
+                task.returncode = future.result()
+                task.status = "done" if task.returncode == 0 else "failed"
+                print(f"[{time.strftime('%H:%M:%S')}] {task.status} {task.name} "
+                      f"(exit {task.returncode}, {task.seconds:.1f} s)")
+    return tasks
+
+def write_status(tasks, status_file):
+    columns = ["sample", "step", "status", "returncode", "threads", "seconds"]
+    with open(status_file, "w", newline="") as fh:
+        writer = csv.writer(fh, delimiter="\t")
+        writer.writerow(columns)
+        for task in tasks.values():
+            writer.writerow([task.sample, task.step, task.status, "" if task.returncode is None else task.returncode,
+                             task.threads, f"{task.seconds:.1f}"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run fastp -> falco / STAR -> featureCounts for every sample of a sample sheet in parallel")
+    parser.add_argument("sample_sheet", nargs="?", default="targets.txt",
+                        help="targets.txt-style sheet: sampleID, developmental_stage[, read1, read2]")
+    parser.add_argument("--fastq-dir", default=fastq_dir, help="where <sampleID>_1/_2.fastq.gz are found")
+    parser.add_argument("--output-dir", default=output_dir)
+    parser.add_argument("--genome-dir", default=genome_dir, help="STAR genome index")
+    parser.add_argument("--annotation", default=annotation_file, help="GTF annotation for featureCounts")
+    parser.add_argument("--cores", type=int, default=None, help="total cores for all jobs (default: all)")
+    parser.add_argument("--memory", type=float, default=None, help="total memory for all jobs in GB (default: all)")
+    parser.add_argument("--star-memory", type=float, default=RESOURCES["star"][2], help="GB one STAR job needs")
+    parser.add_argument("--steps", nargs="+", default=STEPS, choices=STEPS, help="only run these steps")
+    parser.add_argument("--force", action="store_true", help="rerun tasks that already completed")
+    parser.add_argument("--dry-run", action="store_true", help="print the schedule and commands only")
+    parser.add_argument("--stub", action="store_true", help="replace every tool by a short sleep that creates its outputs")
+    parser.add_argument("--stub-fail", nargs="+", default=(), metavar="TASK",
+                        help="with --stub, make these tasks (e.g. star:SRR9690970) or steps fail")
+    parser.add_argument("--status", default=None, help="exit status table (default: <output-dir>/pipeline_status.tsv)")
+    args = parser.parse_args()
+
+    resources = dict(RESOURCES, star=RESOURCES["star"][:2] + (args.star_memory,))
+    samples = read_sample_sheet(args.sample_sheet, args.fastq_dir)
+    tasks = build_tasks(samples, args.output_dir, args.genome_dir, args.annotation, resources)
+    for task in tasks.values():
+        if task.step not in args.steps:
+            task.status = "cached"
+        elif args.stub:
+            task.commands = stub_commands(task, fail=args.stub_fail)
+
+    run_pipeline(tasks, args.cores, args.memory, os.path.join(args.output_dir, "logs"), args.force, args.dry_run)
+    # A dry run creates nothing on disk, not even the status table
+    if not args.dry_run:
+        status_file = args.status or os.path.join(args.output_dir, "pipeline_status.tsv")
+        write_status(tasks, status_file)
+
+    counts = {status: sum(task.status == status for task in tasks.values())
+              for status in ("done", "cached", "failed", "skipped")}
+    print(json.dumps(counts))
+    sys.exit(1 if counts["failed"] or counts["skipped"] else 0)
@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from scipy.stats import nbinom
+
+# The estimator lives with the other downloadable scripts in assets/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets"))
+import genome_estimate  # noqa: E402
+
+# Histogram sizes (number of rows) benchmarked by default
+BINS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+# Ground truth of the synthetic diploid genome
+TRUTH = {
+    "genome_size": 560_000_000,
+    "heterozygosity": 0.012,
+    "repeat_fraction": 0.05,
+    "error_rate": 0.004,
+    "kmer_coverage": 12.0,
+    "overdispersion": 1.2,
+    "k": 21,
+}
+
+def synthetic_histo(bins, truth=TRUTH, seed=0):
+    # Poisson-sampled k-mer spectrum: an exponential error peak, the 1x-4x negative binomial
+    # peaks of a heterozygous genome with duplications, and a sparse power-law tail of
+    # high-copy repeats that stretches the histogram out to `bins` rows
+    rng = np.random.default_rng(seed)
+    coverage = np.arange(1, bins + 1, dtype=np.int64)
+    x = coverage.astype(np.float64)
+
+    a = 1 - (1 - truth["heterozygosity"]) ** truth["k"]
+    d = truth["repeat_fraction"]
+    weights = [2 * (1 - d) * a + d * (1 - a) * a, (1 - d) * (1 - a) + d * a * a, d * (1 - a) * a, d * (1 - a) ** 2 / 2]
+    expected = np.zeros(bins)
+    for copies, weight in enumerate(weights, start=1):
+        mean = copies * truth["kmer_coverage"]
+        size = mean / truth["overdispersion"]
+        expected += truth["genome_size"] * weight * nbinom.pmf(coverage, size, size / (size + mean))
+
+    genomic_kmers = float(np.dot(x, expected))
+    error_share = 1 - (1 - truth["error_rate"]) ** truth["k"]
+    errors = np.exp(-x / 0.7)
+    expected += errors * (error_share / (1 - error_share) * genomic_kmers / np.dot(x, errors))
+    expected += 50.0 * (x / 100.0) ** -2.5 * (x > 8 * truth["kmer_coverage"])
+
+    frequency = rng.poisson(expected).astype(np.int64)
+    return coverage, frequency
+
+def write_histo(coverage, frequency, path):
+    np.savetxt(path, np.column_stack([coverage, frequency]), fmt="%d")
+
+def timed(function, *args):
+    # Wall time and peak traced allocation (NumPy buffers included) of one stage, from two
+    # separate calls: tracemalloc hooks every allocation and would inflate the timing
+    started = time.perf_counter()
+    value = function(*args)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return value, elapsed, peak
+
+def bench_case(bins, repeat=3, fit=True, seed=0):
+    coverage, frequency = synthetic_histo(bins, seed=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"k_{TRUTH['k']}_mer_counts.histo")
+        write_histo(coverage, frequency, path)
+        histo_bytes = os.path.getsize(path)
+
+        stages = {}
+        for _ in range(repeat):
+            (coverage, frequency), *parse = timed(genome_estimate.load_histo, path)
+            (start, end), *trim = timed(genome_estimate.detect_bounds, frequency)
+            peak, *peak_stats = timed(genome_estimate.estimate_coverage_peak, coverage[start:end], frequency[start:end])
+            size, *size_stats = timed(genome_estimate.estimate_genome_size, coverage[start:end], frequency[start:end], peak)
+            runs = {"parse": parse, "trim": trim, "peak": peak_stats, "size": size_stats}
+            if fit:
+                model, *fit_stats = timed(genome_estimate.fit_spectrum, coverage, frequency, start, end, peak, TRUTH["k"])
+                runs["fit"] = fit_stats
+            # Keep the fastest run of every stage
+            for stage, (seconds, peak_bytes) in runs.items():
+                best = stages.get(stage)
+                if best is None or seconds < best["seconds"]:
+                    stages[stage] = {"seconds": seconds, "peak_bytes": peak_bytes}
+
+    estimates = {"start": start, "end": end, "coverage_peak": peak, "genome_size": size}
+    if fit and model:
+        estimates.update(model)
+    errors = {"genome_size": size / TRUTH["genome_size"] - 1}
+    if fit and model:
+        errors["model_genome_size"] = model["model_genome_size"] / TRUTH["genome_size"] - 1
+        for key in ("heterozygosity", "repeat_fraction", "error_rate", "kmer_coverage"):
+            errors[key] = model[key] / TRUTH[key] - 1
+
+    return {
+        "bins": bins,
+        "histo_bytes": histo_bytes,
+        "stages": stages,
+        "total_seconds": sum(stage["seconds"] for stage in stages.values()),
+        "estimates": estimates,
+        "relative_errors": errors,
+    }
+
+def compare(current, previous_file):
+    # Print the speed ratio and accuracy drift of every case against an earlier JSON report
+    with open(previous_file) as fh:
+        previous = {case["bins"]: case for case in json.load(fh)["cases"]}
+    for case in current["cases"]:
+        old = previous.get(case["bins"])
+        if old is None:
+            continue
+        ratios = {stage: case["stages"][stage]["seconds"] / old["stages"][stage]["seconds"]
+                  for stage in case["stages"] if stage in old["stages"] and old["stages"][stage]["seconds"]}
+        drift = {key: case["relative_errors"][key] - old["relative_errors"].get(key, 0.0)
+                 for key in case["relative_errors"]}
+        print(f"{case['bins']:>10} rows  time x " + "  ".join(f"{stage} {ratio:.2f}" for stage, ratio in ratios.items()))
+        print(f"{'':>16}error drift " + "  ".join(f"{key} {value:+.4f}" for key, value in drift.items()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark genome_estimate.py on synthetic k-mer spectra")
+    parser.add_argument("--bins", type=float, nargs="+", default=BINS, help="histogram sizes (rows) to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size, the fastest is kept")
+    parser.add_argument("--no-fit", action="store_true", help="skip the negative binomial mixture fit")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="genome_estimate_bench.json", help="machine-readable results")
+    parser.add_argument("--compare", default=None, metavar="JSON", help="earlier results to compare against")
+    args = parser.parse_args()
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "truth": TRUTH,
+        "cases": [],
+    }
+    for bins in args.bins:
+        case = bench_case(int(bins), args.repeat, not args.no_fit, args.seed)
+        report["cases"].append(case)
+        print(f"{case['bins']:>10} rows  {case['total_seconds'] * 1000:9.1f} ms  "
+              + "  ".join(f"{stage} {stats['seconds'] * 1000:.1f} ms/{stats['peak_bytes'] / 2 ** 20:.1f} MiB"
+                          for stage, stats in case["stages"].items())
+              + f"  genome size error {case['relative_errors']['genome_size'] * 100:+.2f}%")
+    report["max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    with open(args.output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    if args.compare:
+        compare(report, args.compare)
@@ -0,0 +1,162 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# The app and its packages (phases/, utils/) live one directory up
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+APP_FILE = os.path.join(APP_DIR, "logbook.py")
+sys.path.insert(0, APP_DIR)
+
+TIMEOUT = 120
+
+# Warm reruns made under tracemalloc for the memory peak, after (and apart from) the timed ones
+TRACED_RERUNS = 3
+
+def new_app(phase):
+    # option_menu is a custom component AppTest cannot click, so a phase is selected the way a
+    # search hit link does it, through the ?phase= query parameter
+    from streamlit.testing.v1 import AppTest
+
+    # Sessions are created outside a script run, which streamlit warns about every time
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    app = AppTest.from_file(APP_FILE, default_timeout=TIMEOUT)
+    app.query_params["phase"] = phase
+    return app
+
+def count_elements(node):
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return 1 + sum(count_elements(child) for child in children.values())
+
+def run_app(app):
+    started = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - started
+    if app.exception:
+        raise RuntimeError(f"Error: the app raised {app.exception[0].message}")
+    return elapsed
+
+def cold_start(phase, trace=False):
+    # Called in a fresh interpreter (see --cold), so every import, compile and cache starts empty.
+    # tracemalloc slows every allocation down, so a traced run only reports the memory peak
+    if trace:
+        tracemalloc.start()
+        run_app(new_app(phase))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return {"peak_traced_bytes": peak}
+    started = time.perf_counter()
+    app = new_app(phase)
+    run_app(app)
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "elements": count_elements(app._tree),
+    }
+
+def cold_start_subprocess(phase):
+    # AppTest installs the app script as __main__, so every cold run gets its own interpreter:
+    # one timed, one traced
+    result = {}
+    for extra in ([], ["--trace"]):
+        process = subprocess.run([sys.executable, os.path.abspath(__file__), "--cold", phase, *extra],
+                                 capture_output=True, text=True, check=True)
+        result.update(json.loads(process.stdout.splitlines()[-1]))
+    return result
+
+def latency_stats(seconds):
+    ms = np.array(seconds) * 1000
+    return {"runs": len(ms), "p50_ms": float(np.percentile(ms, 50)), "p95_ms": float(np.percentile(ms, 95)),
+            "mean_ms": float(ms.mean()), "max_ms": float(ms.max())}
+
+def warm_reruns(phase, reruns):
+    app = new_app(phase)
+    run_app(app)
+    seconds = [run_app(app) for _ in range(reruns)]
+    tracemalloc.start()
+    for _ in range(TRACED_RERUNS):
+        run_app(app)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dict(latency_stats(seconds), peak_traced_bytes=peak, elements=count_elements(app._tree))
+
+def concurrent_sessions(phases, sessions, reruns):
+    # Independent sessions (one AppTest each, cycling through the phases) rerunning at the same
+    # time in one process, sharing its st.cache_resource/st.cache_data entries like a real server
+    def session(i):
+        app = new_app(phases[i % len(phases)])
+        return [run_app(app) for _ in range(reruns)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        seconds = [value for values in executor.map(session, range(sessions)) for value in values]
+    wall = time.perf_counter() - started
+    return dict(latency_stats(seconds), sessions=sessions, wall_seconds=wall, reruns_per_second=len(seconds) / wall)
+
+def compare(current, previous_file):
+    # Print the latency and page-weight change of every phase against an earlier JSON report
+    with open(previous_file) as fh:
+        previous = json.load(fh)["phases"]
+    for phase, result in current["phases"].items():
+        old = previous.get(phase)
+        if old is None:
+            continue
+        print(f"{phase:>8}  cold x {result['cold']['seconds'] / old['cold']['seconds']:.2f}  "
+              f"warm p50 x {result['warm']['p50_ms'] / old['warm']['p50_ms']:.2f}  "
+              f"elements {old['warm']['elements']} -> {result['warm']['elements']}")
+
+if __name__ == "__main__":
+    from phases import PHASES
+
+    parser = argparse.ArgumentParser(description="Benchmark logbook.py reruns headlessly with Streamlit's AppTest")
+    parser.add_argument("--phases", nargs="+", default=list(PHASES.values()), choices=list(PHASES.values()))
+    parser.add_argument("--reruns", type=int, default=20, help="warm reruns per phase")
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent sessions, 0 to skip")
+    parser.add_argument("--output", default="logbook_bench.json", help="machine-readable results")
+    parser.add_argument("--compare", default=None, metavar="JSON", help="earlier results to compare against")
+    parser.add_argument("--cold", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold:
+        print(json.dumps(cold_start(args.cold, args.trace)))
+        sys.exit(0)
+
+    import streamlit
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "machine": platform.machine(),
+        "phases": {},
+    }
+    for phase in args.phases:
+        cold = cold_start_subprocess(phase)
+        warm = warm_reruns(phase, args.reruns)
+        report["phases"][phase] = {"cold": cold, "warm": warm}
+        print(f"{phase:>8}  cold {cold['seconds'] * 1000:8.1f} ms  warm p50 {warm['p50_ms']:7.1f} ms  "
+              f"p95 {warm['p95_ms']:7.1f} ms  {warm['elements']:4d} elements  "
+              f"peak {cold['peak_traced_bytes'] / 2 ** 20:.1f} MiB")
+    if args.sessions:
+        report["concurrent"] = concurrent_sessions(args.phases, args.sessions, args.reruns)
+        result = report["concurrent"]
+        print(f"{args.sessions} sessions  p50 {result['p50_ms']:.1f} ms  p95 {result['p95_ms']:.1f} ms  "
+              f"{result['reruns_per_second']:.1f} reruns/s")
+
+    with open(args.output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    if args.compare:
+        compare(report, args.compare)
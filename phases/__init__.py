@@ -0,0 +1,36 @@
+import importlib
+
+from utils.profiling import section, settings
+
+# option_menu label -> module of this package that renders the page
+PHASES = {
+    "Phase 1: Sequence-Based Analysis": "phase1",
+    "Phase 2: Reference-Based Transcriptomics Analysis": "phase2",
+    "Phase 3: Structure-Based Analysis": "phase3",
+    "Phase 4: Molecular Docking & Dynamics Simulation": "phase4",
+    "Additional Notes": "notes",
+}
+
+# Pages left out of the menu, opened with ?page=<name>
+HIDDEN_PAGES = {"diagnostics", "qc"}
+
+
+def requested_phase(query_params):
+    # Menu index and step of a search hit link (?phase=phase1&step=12), or the first phase
+    names = list(PHASES.values())
+    name = query_params.get("phase")
+    if name not in names:
+        return 0, None
+    step = query_params.get("step", "")
+    return names.index(name), int(step) if step.isdigit() else None
+
+
+def render_module(name, focus=None):
+    # importlib keeps the module in sys.modules, so a page is only compiled the first time it is shown
+    with section(name, profile=settings()["profile"]):
+        module = importlib.import_module(f"{__name__}.{name}")
+        module.render(focus)
+
+
+def render_phase(selected, focus=None):
+    render_module(PHASES[selected], focus)
@@ -0,0 +1,38 @@
+import streamlit as st
+
+from utils.importtime import APP_DIR, importtime_report, measure_imports
+from utils.lazy import IMPORT_TIMES
+
+# Diagnostics (hidden page, opened with ?page=diagnostics)
+
+# Measuring again only reruns this fragment
+@st.fragment
+def render_importtime():
+    if st.button("Measure again"):
+        measure_imports.clear()
+    report = importtime_report(APP_DIR / "logbook.py")
+    if report["returncode"]:
+        st.error("Importing the startup modules failed, the timings below are incomplete.")
+    st.metric("Total import time", f"{report['total_ms']:.0f} ms")
+    st.dataframe(report["top_level"], column_order=["module", "cumulative_ms", "self_ms"], hide_index=True)
+    st.write("✔️slowest individual modules (self time)")
+    st.dataframe(report["slowest"], column_order=["module", "self_ms", "cumulative_ms", "depth"], hide_index=True)
+
+
+def render(focus=None):
+    with st.container():
+        st.write("---")
+        st.header("Diagnostics 🩺")
+        st.write("###")
+
+        st.write("**Cold-start imports of logbook.py** (`python -X importtime` in a fresh interpreter)")
+        render_importtime()
+
+        st.write("###")
+
+        st.write("**Modules loaded lazily by this process**")
+        if IMPORT_TIMES:
+            st.dataframe([{"module": name, "import_ms": seconds * 1000} for name, seconds in IMPORT_TIMES.items()],
+                         hide_index=True)
+        else:
+            st.write("none yet")
@@ -0,0 +1,7 @@
+from utils.content import render_page
+
+# Additional Note
+
+def render(focus=None):
+    # Steps, notes, commands and downloads live in content/notes.toml
+    render_page("notes", focus)
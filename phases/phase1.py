@@ -0,0 +1,7 @@
+from utils.content import render_page
+
+# Phase 1: Sequence-Based Analysis
+
+def render(focus=None):
+    # Steps, notes, commands and downloads live in content/phase1.toml
+    render_page("phase1", focus)
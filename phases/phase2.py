@@ -0,0 +1,7 @@
+from utils.content import render_page
+
+# Phase 2: Reference-Based Transcriptomics Analysis
+
+def render(focus=None):
+    # Steps, notes, commands and downloads live in content/phase2.toml
+    render_page("phase2", focus)
@@ -0,0 +1,7 @@
+from utils.content import render_page
+
+# Phase 3: Structure-Based Analysis
+
+def render(focus=None):
+    # Steps, notes, commands and downloads live in content/phase3.toml
+    render_page("phase3", focus)
@@ -0,0 +1,7 @@
+from utils.content import render_page
+
+# Phase 4: Molecular Docking & Dynamics Simulation
+
+def render(focus=None):
+    # Steps, notes, commands and downloads live in content/phase4.toml
+    render_page("phase4", focus)
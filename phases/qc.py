@@ -0,0 +1,96 @@
+import os
+
+import streamlit as st
+
+from utils.fastqc import FALCO_DIRS, SUFFIX, load_qc
+from utils.reports import scan_reports
+
+# Falco QC summary (hidden page, opened with ?page=qc from the Falco steps of Phase 1)
+
+STATUS_ICON = {"pass": "✅", "warn": "⚠️", "fail": "❌"}
+
+# Modules shown as columns of the status table, in report order
+MODULES = [
+    "Basic Statistics", "Per base sequence quality", "Per tile sequence quality", "Per sequence quality scores",
+    "Per base sequence content", "Per sequence GC content", "Per base N content", "Sequence Length Distribution",
+    "Sequence Duplication Levels", "Overrepresented sequences", "Adapter Content",
+]
+
+
+def _general_statistics(tables):
+    reports = tables["reports"].to_pandas().set_index("sample").sort_index()
+    statuses = tables["modules"].to_pandas().pivot_table(index="sample", columns="module", values="status",
+                                                         aggfunc="first")
+    statuses = statuses[[module for module in MODULES if module in statuses.columns]].map(STATUS_ICON.get)
+    general = reports[["total_sequences", "sequence_length", "gc", "deduplicated", "poor_quality"]].rename(columns={
+        "total_sequences": "Sequences", "sequence_length": "Length", "gc": "% GC", "deduplicated": "% Dedup.",
+        "poor_quality": "Poor quality"})
+    return general.join(statuses)
+
+
+def _per_sample(table, x, y):
+    # Long rows (sample, x, y) -> one column per sample, for st.line_chart
+    return table.to_pandas().pivot_table(index=x, columns="sample", values=y, aggfunc="sum").sort_index()
+
+
+# Switching the report directory only reruns this fragment
+@st.fragment
+def render_summary():
+    choice = st.selectbox("Falco reports", [*FALCO_DIRS, "Other directory"], key="qc_source")
+    directory = FALCO_DIRS.get(choice) or st.text_input("Directory with the *_fastqc_data.txt files", key="qc_dir")
+    if not directory:
+        return
+    if not os.path.isdir(directory):
+        st.error(f"Error: '{directory}' is not a directory on this machine.")
+        return
+    reports = scan_reports(directory, SUFFIX)
+    if not reports:
+        st.info(f"No *_fastqc_data.txt files in '{directory}' yet (run falco1.sh / falco2.sh first).")
+        return
+    tables = load_qc(directory, reports)
+    refresh = tables["refresh"]
+    st.caption(f"{refresh['reports']} reports · {refresh['parsed']} parsed and {refresh['removed']} removed "
+               f"when the store was last refreshed")
+    if refresh["failed"]:
+        st.warning(f"Skipped {len(refresh['failed'])} unreadable or incomplete report(s): "
+                   f"{', '.join(refresh['failed'])}")
+
+    st.write("**General statistics**")
+    st.dataframe(_general_statistics(tables), column_config={
+        "Sequences": st.column_config.NumberColumn(format="%d"),
+        "% GC": st.column_config.NumberColumn(format="%.0f"),
+        "% Dedup.": st.column_config.NumberColumn(format="%.1f"),
+    })
+
+    left_column, right_column = st.columns((1, 1))
+    with left_column:
+        st.write("**Per base sequence quality** (mean Phred score)")
+        st.line_chart(_per_sample(tables["per_base_quality"], "position", "mean"), x_label="Position (bp)",
+                      y_label="Phred score")
+    with right_column:
+        st.write("**Per sequence GC content**")
+        st.line_chart(_per_sample(tables["gc_content"], "gc", "count"), x_label="% GC", y_label="Reads")
+
+    left_column, right_column = st.columns((1, 1))
+    with left_column:
+        st.write("**Adapter content** (all adapters, cumulative %)")
+        st.line_chart(_per_sample(tables["adapter_content"], "position", "percentage"), x_label="Position (bp)",
+                      y_label="% of reads")
+    with right_column:
+        st.write("**Overrepresented sequences**")
+        overrepresented = tables["overrepresented"].to_pandas()
+        if overrepresented.empty:
+            st.write("none in any report ✅")
+        else:
+            st.dataframe(overrepresented.sort_values("percentage", ascending=False)
+                         [["sample", "sequence", "count", "percentage", "source"]], hide_index=True)
+
+
+def render(focus=None):
+    with st.container():
+        st.write("---")
+        st.header("Quality Control Summary 📊")
+        st.write("###")
+        st.write("Every Falco *_fastqc_data.txt report of a directory in one place; only new or rewritten reports "
+                 "are parsed into the Parquet store, the others are read back from it")
+        render_summary()
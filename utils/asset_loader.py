@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import streamlit as st
+from PIL import Image
+
+from utils.profiling import count_read
+
+# Old versions of a changed file stay cached under their previous mtime until evicted
+MAX_ENTRIES = 64
+
+
+def asset_version(path):
+    # (path, mtime) is the cache key, so an edited or replaced asset is picked up on the next rerun
+    try:
+        return Path(path).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Bytes are immutable, so one copy is shared by every session instead of being unpickled per rerun
+@st.cache_resource(max_entries=MAX_ENTRIES, show_spinner=False)
+def _read_bytes(path, mtime_ns):
+    data = Path(path).read_bytes()
+    count_read(len(data))
+    return data
+
+
+@st.cache_resource(max_entries=MAX_ENTRIES, show_spinner=False)
+def _decode_image(path, mtime_ns):
+    image = Image.open(path)
+    image.load()
+    count_read(Path(path).stat().st_size)
+    return image
+
+
+def load_bytes(path):
+    # Contents of a downloadable asset, or None if it does not exist
+    mtime_ns = asset_version(path)
+    if mtime_ns is None:
+        return None
+    return _read_bytes(str(path), mtime_ns)
+
+
+def load_image(path):
+    # Decoded image shared across sessions, or None if it does not exist
+    mtime_ns = asset_version(path)
+    if mtime_ns is None:
+        return None
+    return _decode_image(str(path), mtime_ns)
@@ -0,0 +1,150 @@
+import hashlib
+import importlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import streamlit as st
+
+try:
+    import tomllib
+except ImportError:
+    # Python 3.10: the same parser from PyPI (pip install tomli)
+    import tomli as tomllib
+
+from utils.images import render_image
+from utils.manifest import ASSETS_DIR, render_download
+from utils.profiling import count_read, section, settings
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+
+# Display width of figures (image blocks) that do not set their own
+FIGURE_WIDTH = 600
+
+# A text block in bold or starting with "12. " opens a new step of the page
+STEP_TITLE = re.compile(r"^(\*\*|\d+[a-z]?\.\s)")
+
+# Interactive blocks: widget key -> (module, function called with the render scope); the module
+# is only imported when a page showing the widget is rendered
+WIDGETS = {
+    "fastp_summary": ("utils.fastp", "render_summary"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    title: str | None
+    blocks: list
+    ops: list
+
+
+@dataclass(frozen=True, slots=True)
+class Page:
+    sections: list
+    ops: list
+
+
+def _fence(code, language):
+    # A fence longer than any backtick run inside the code keeps the block intact
+    longest = max((len(run) for run in re.findall(r"`+", code)), default=0)
+    fence = "`" * max(3, longest + 1)
+    return f"{fence}{language}\n{code.lstrip(chr(10)).rstrip()}\n{fence}"
+
+
+# Every [[blocks]] entry of a content/*.toml page is one of:
+#   text     markdown
+#   header   st.header title
+#   code     code block, with an optional language (default python)
+#   asset    download button, key in utils/manifest.py ASSETS
+#   image    file in assets/, with an optional width (default FIGURE_WIDTH) and caption
+#   widget   interactive block, key in WIDGETS
+def _group(blocks):
+    # Consecutive text and code blocks are merged into a single markdown element,
+    # so a page costs one render call per asset instead of one per line
+    ops = []
+    pending = []
+    for block in blocks:
+        if "text" in block:
+            pending.append(block["text"])
+        elif "code" in block:
+            pending.append(_fence(block["code"], block.get("language", "python")))
+        else:
+            if pending:
+                ops.append(("markdown", "\n\n".join(pending)))
+                pending = []
+            if "header" in block:
+                ops.append(("header", block["header"]))
+            elif "asset" in block:
+                ops.append(("asset", block["asset"]))
+            elif "image" in block:
+                ops.append(("image", (block["image"], block.get("width", FIGURE_WIDTH), block.get("caption"))))
+            elif block.get("widget") in WIDGETS:
+                ops.append(("widget", block["widget"]))
+            else:
+                raise ValueError(f"Error: unknown content block {sorted(block)}.")
+    if pending:
+        ops.append(("markdown", "\n\n".join(pending)))
+    return ops
+
+
+def step_title(text):
+    return text.replace("*", "").strip()
+
+
+# Compiled once per content hash, both as a whole page and step by step (for search jumps)
+@st.cache_resource(max_entries=32, show_spinner=False)
+def compile_blocks(digest, text):
+    blocks = tomllib.loads(text)["blocks"]
+    grouped = [[None, []]]
+    for block in blocks:
+        if "text" in block and STEP_TITLE.match(block["text"]):
+            grouped.append([step_title(block["text"]), []])
+        grouped[-1][1].append(block)
+    sections = [Section(title, step_blocks, _group(step_blocks)) for title, step_blocks in grouped]
+    return Page(sections, _group(blocks))
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _compile_file(path, mtime_ns):
+    data = Path(path).read_bytes()
+    count_read(len(data))
+    text = data.decode("utf-8").replace("\r\n", "\n")
+    return compile_blocks(hashlib.sha256(text.encode("utf-8")).hexdigest(), text)
+
+
+def load_page(name):
+    path = CONTENT_DIR / f"{name}.toml"
+    return _compile_file(str(path), path.stat().st_mtime_ns)
+
+
+def _render_ops(ops, scope="page"):
+    for kind, value in ops:
+        if kind == "markdown":
+            st.markdown(value)
+        elif kind == "header":
+            st.header(value)
+        elif kind == "image":
+            name, width, caption = value
+            render_image(ASSETS_DIR / name, width, caption)
+        elif kind == "widget":
+            module, function = WIDGETS[value]
+            getattr(importlib.import_module(module), function)(scope)
+        else:
+            render_download(value, scope)
+
+
+def render_page(name, focus=None):
+    # `focus` is the index of a step opened from a search hit, shown above the whole page
+    page = load_page(name)
+    if focus is not None and 0 < focus < len(page.sections):
+        with st.container(border=True):
+            st.caption("🔎 Search result")
+            _render_ops(page.sections[focus].ops, "focus")
+    with st.container():
+        if not settings()["steps"]:
+            _render_ops(page.ops)
+            return
+        # Step by step (one markdown element per step instead of per page) so each gets its own timing
+        for step, page_section in enumerate(page.sections):
+            with section(f"{name} · step {step}"):
+                _render_ops(page_section.ops)
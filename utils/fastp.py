@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+from utils.profiling import count_read
+from utils.reports import scan_reports, store_path
+
+pa = lazy_import("pyarrow")
+pq = lazy_import("pyarrow.parquet")
+
+# fastp.sh writes <sample>_report.json next to the trimmed reads
+FASTP_DIR = "/home/cbr16/Documents/WeeYeZhi/output/fastpresults"
+
+SUFFIX = "_report.json"
+
+# Parsed reports, keyed by the SHA-256 of the JSON; survives restarts like the Falco store
+STORE_DIR = Path.home() / ".cache" / "logbook" / "fastp"
+
+# Below this many reports to parse, starting a process pool costs more than it saves
+PARALLEL_MIN = 32
+
+# Columns of the compact table: one row per report, "before"/"after" refer to fastp's filtering
+COLUMNS = [
+    ("file", "string"), ("mtime_ns", "int64"), ("size", "int64"), ("sha256", "string"), ("sample", "string"),
+    ("reads_before", "int64"), ("reads_after", "int64"), ("bases_before", "int64"), ("bases_after", "int64"),
+    ("q20_before", "float64"), ("q20_after", "float64"), ("q30_before", "float64"), ("q30_after", "float64"),
+    ("gc_before", "float64"), ("gc_after", "float64"), ("read1_length_before", "float64"),
+    ("read1_length_after", "float64"), ("duplication", "float64"), ("insert_size_peak", "int64"),
+    ("low_quality_reads", "int64"), ("too_many_n_reads", "int64"), ("too_short_reads", "int64"),
+    ("adapter_trimmed_reads", "int64"), ("adapter_trimmed_bases", "int64"),
+]
+
+
+def _schema():
+    return pa.schema([(name, getattr(pa, kind)()) for name, kind in COLUMNS])
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def summarize(data):
+    # The handful of numbers the dashboard needs out of a fastp JSON report (which also holds
+    # per-position curves and k-mer tables, by far its largest part)
+    report = json.loads(data)
+    summary = report.get("summary", {})
+    before, after = summary.get("before_filtering", {}), summary.get("after_filtering", {})
+    filtering = report.get("filtering_result", {})
+    adapters = report.get("adapter_cutting", {})
+    row = {}
+    for stage, values in (("before", before), ("after", after)):
+        row[f"reads_{stage}"] = values.get("total_reads")
+        row[f"bases_{stage}"] = values.get("total_bases")
+        row[f"q20_{stage}"] = values.get("q20_rate")
+        row[f"q30_{stage}"] = values.get("q30_rate")
+        row[f"gc_{stage}"] = values.get("gc_content")
+        row[f"read1_length_{stage}"] = values.get("read1_mean_length")
+    row.update({
+        "duplication": report.get("duplication", {}).get("rate"),
+        "insert_size_peak": report.get("insert_size", {}).get("peak"),
+        "low_quality_reads": filtering.get("low_quality_reads"),
+        "too_many_n_reads": filtering.get("too_many_N_reads"),
+        "too_short_reads": filtering.get("too_short_reads"),
+        "adapter_trimmed_reads": adapters.get("adapter_trimmed_reads"),
+        "adapter_trimmed_bases": adapters.get("adapter_trimmed_bases"),
+    })
+    return row
+
+
+def _load_report(path, known):
+    # Runs in the worker processes: read once, hash, and only parse the JSON when the hash is new.
+    # Returns (path, sha256, row or None, bytes read)
+    data = Path(path).read_bytes()
+    digest = sha256(data)
+    if digest in known:
+        return path, digest, None, len(data)
+    try:
+        return path, digest, summarize(data), len(data)
+    except (ValueError, AttributeError):
+        return path, digest, {}, len(data)
+
+
+def refresh_table(directory, reports, store_dir=STORE_DIR):
+    # Reports whose (mtime, size) match the stored row are taken as is without being opened. The
+    # others are read and hashed; a hash already in the store (a copied or touched report) reuses
+    # its row, and only reports with new content are parsed, in a process pool when there are many
+    store = store_path(directory, store_dir).with_suffix(".parquet")
+    stored = []
+    if store.exists():
+        count_read(store.stat().st_size)
+        stored = pq.read_table(store, schema=_schema()).to_pylist()
+    by_file = {row["file"]: row for row in stored}
+    by_hash = {row["sha256"]: row for row in stored}
+    rows, stale = [], []
+    for path, mtime_ns, size in reports:
+        row = by_file.get(path)
+        if row and (row["mtime_ns"], row["size"]) == (mtime_ns, size):
+            rows.append(row)
+        else:
+            stale.append((path, mtime_ns, size))
+    parsed = 0
+    if stale:
+        paths = [path for path, _, _ in stale]
+        known = frozenset(by_hash)
+        if len(stale) >= PARALLEL_MIN:
+            with ProcessPoolExecutor() as executor:
+                loaded = list(executor.map(_load_report, paths, [known] * len(paths), chunksize=8))
+        else:
+            loaded = [_load_report(path, known) for path in paths]
+        for (path, mtime_ns, size), (_, digest, summary, nbytes) in zip(stale, loaded):
+            count_read(nbytes)
+            if summary is None:
+                summary = dict(by_hash[digest])
+            else:
+                parsed += 1
+            summary.update({"file": path, "mtime_ns": mtime_ns, "size": size, "sha256": digest,
+                            "sample": os.path.basename(path)[:-len(SUFFIX)]})
+            rows.append(summary)
+    if stale or len(rows) != len(stored):
+        store.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.Table.from_pylist(rows, schema=_schema()), f"{store}.tmp")
+        os.replace(f"{store}.tmp", store)
+    table = pa.Table.from_pylist(sorted(rows, key=lambda row: row["sample"]), schema=_schema())
+    return table, {"reports": len(rows), "hashed": len(stale), "parsed": parsed}
+
+
+@st.cache_resource(max_entries=4, show_spinner="Reading fastp reports ...")
+def load_fastp(directory, reports):
+    # Keyed by the scan, so reruns and reopened pages reuse the table until a report changes
+    return refresh_table(directory, reports)
+
+
+def _before_after(table, metric, scale=1):
+    frame = table.select(["sample", f"{metric}_before", f"{metric}_after"]).to_pandas().set_index("sample")
+    return frame.rename(columns={f"{metric}_before": "before", f"{metric}_after": "after"}) * scale
+
+
+# Changing the directory only reruns this fragment; `scope` keeps its widgets apart when the
+# step is also shown as a search result
+@st.fragment
+def render_summary(scope="page"):
+    directory = st.text_input("Directory with the fastp *_report.json files", FASTP_DIR, key=f"fastp_dir_{scope}")
+    if not os.path.isdir(directory):
+        st.info(f"'{directory}' is not a directory on this machine; the trimming summary appears once fastp.sh "
+                f"has written its reports there.")
+        return
+    reports = scan_reports(directory, SUFFIX)
+    if not reports:
+        st.info(f"No *{SUFFIX} files in '{directory}' yet.")
+        return
+    table, refresh = load_fastp(directory, reports)
+    frame = table.to_pandas()
+    st.caption(f"{refresh['reports']} reports · {refresh['hashed']} hashed and {refresh['parsed']} parsed when the "
+               f"table was last refreshed")
+
+    reads_before, reads_after = frame["reads_before"].sum(), frame["reads_after"].sum()
+    columns = st.columns(4)
+    columns[0].metric("Samples", len(frame))
+    columns[1].metric("Reads kept", f"{reads_after / 1e6:,.1f} M",
+                      f"{reads_after / max(reads_before, 1) - 1:.1%}")
+    columns[2].metric("Mean Q30", f"{frame['q30_after'].mean():.1%}",
+                      f"{frame['q30_after'].mean() - frame['q30_before'].mean():+.1%}")
+    columns[3].metric("Mean duplication", f"{frame['duplication'].mean():.1%}")
+
+    left_column, right_column = st.columns((1, 1))
+    with left_column:
+        st.write("**Reads before / after trimming** (millions)")
+        st.bar_chart(_before_after(table, "reads", 1e-6), stack=False)
+    with right_column:
+        st.write("**Q30 rate before / after trimming** (%)")
+        st.bar_chart(_before_after(table, "q30", 100), stack=False)
+
+    st.write("**Per sample**")
+    frame["passed"] = frame["reads_after"] / frame["reads_before"]
+    st.dataframe(frame, hide_index=True, column_order=[
+        "sample", "reads_before", "reads_after", "passed", "q20_before", "q20_after", "q30_before", "q30_after",
+        "gc_before", "gc_after", "duplication", "insert_size_peak", "too_short_reads", "low_quality_reads",
+        "too_many_n_reads", "adapter_trimmed_reads"],
+        column_config={name: st.column_config.NumberColumn(format="percent") for name in [
+            "passed", "q20_before", "q20_after", "q30_before", "q30_after", "gc_before", "gc_after", "duplication"]})
@@ -0,0 +1,159 @@
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from utils.lazy import lazy_import
+from utils.profiling import count_read
+from utils.reports import store_path
+
+pa = lazy_import("pyarrow")
+pq = lazy_import("pyarrow.parquet")
+
+# Falco output of falco1.sh (raw reads) and falco2.sh (fastp-trimmed reads) on the lab server
+FALCO_DIRS = {
+    "Raw reads (falco1.sh)": "/home/cbr16/Documents/WeeYeZhi/output/raw/falcoresults",
+    "Trimmed reads (falco2.sh)": "/home/cbr16/Documents/WeeYeZhi/output/processed/falcoresults",
+}
+
+# One Parquet store per report directory; survives restarts like the image variants
+STORE_DIR = Path.home() / ".cache" / "logbook" / "qc"
+
+SUFFIX = "_fastqc_data.txt"
+
+# Columns of every table of the store; each row carries the report file it came from, so the rows
+# of a changed or deleted report can be dropped without touching the others
+SCHEMAS = {
+    "reports": [("file", "string"), ("sample", "string"), ("mtime_ns", "int64"), ("size", "int64"),
+                ("encoding", "string"), ("total_sequences", "int64"), ("poor_quality", "int64"),
+                ("sequence_length", "string"), ("gc", "float64"), ("deduplicated", "float64")],
+    "modules": [("file", "string"), ("sample", "string"), ("module", "string"), ("status", "string")],
+    "per_base_quality": [("file", "string"), ("sample", "string"), ("base", "string"), ("position", "int32"),
+                         ("mean", "float64"), ("median", "float64"), ("lower_quartile", "float64"),
+                         ("upper_quartile", "float64"), ("p10", "float64"), ("p90", "float64")],
+    "gc_content": [("file", "string"), ("sample", "string"), ("gc", "int32"), ("count", "float64")],
+    "adapter_content": [("file", "string"), ("sample", "string"), ("position", "int32"), ("adapter", "string"),
+                        ("percentage", "float64")],
+    "overrepresented": [("file", "string"), ("sample", "string"), ("sequence", "string"), ("count", "int64"),
+                        ("percentage", "float64"), ("source", "string")],
+}
+
+# fastqc_data.txt "Basic Statistics" measure -> column of the reports table
+BASIC_STATISTICS = {
+    "Encoding": ("encoding", str),
+    "Total Sequences": ("total_sequences", int),
+    "Sequences flagged as poor quality": ("poor_quality", int),
+    "Sequence length": ("sequence_length", str),
+    "%GC": ("gc", float),
+}
+
+
+def _schema(table):
+    return pa.schema([(name, getattr(pa, kind)()) for name, kind in SCHEMAS[table]])
+
+
+def _position(base):
+    # Falco groups later bases ("10-14"); a group is plotted at its first base
+    return int(base.split("-")[0])
+
+
+def _number(value):
+    return float(value) if value not in ("", "NA") else None
+
+
+def parse_report(path):
+    # Streams one fastqc_data.txt (">>Module<TAB>status", "#header", rows, ">>END_MODULE") into rows
+    # of every table of the store; modules that are not stored are only kept as a status
+    path = str(path)
+    sample = os.path.basename(path)[:-len(SUFFIX)]
+    stat = os.stat(path)
+    rows = {table: [] for table in SCHEMAS}
+    report = {"file": path, "sample": sample, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    module = header = None
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            fields = line.rstrip("\r\n").split("\t")
+            if fields[0].startswith(">>"):
+                module = None if fields[0] == ">>END_MODULE" else fields[0][2:]
+                header = None
+                if module:
+                    rows["modules"].append((path, sample, module, fields[1] if len(fields) > 1 else ""))
+            elif fields[0] == "#Total Deduplicated Percentage":
+                report["deduplicated"] = _number(fields[1])
+            elif fields[0].startswith("#"):
+                header = [fields[0][1:]] + fields[1:]
+            elif module is None or header is None or not fields[0]:
+                continue
+            elif module == "Basic Statistics":
+                if fields[0] in BASIC_STATISTICS:
+                    column, kind = BASIC_STATISTICS[fields[0]]
+                    report[column] = kind(fields[1])
+            elif module == "Per base sequence quality":
+                rows["per_base_quality"].append((path, sample, fields[0], _position(fields[0]),
+                                                 *map(_number, fields[1:7])))
+            elif module == "Per sequence GC content":
+                rows["gc_content"].append((path, sample, int(fields[0]), _number(fields[1])))
+            elif module == "Adapter Content":
+                position = _position(fields[0])
+                for adapter, value in zip(header[1:], fields[1:]):
+                    rows["adapter_content"].append((path, sample, position, adapter, _number(value)))
+            elif module == "Overrepresented sequences":
+                rows["overrepresented"].append((path, sample, fields[0], int(fields[1]), _number(fields[2]),
+                                                fields[3] if len(fields) > 3 else ""))
+    count_read(stat.st_size)
+    rows["reports"].append(tuple(report.get(name) for name, _ in SCHEMAS["reports"]))
+    return rows
+
+
+def _read(store, table, files=None):
+    path = store / f"{table}.parquet"
+    if not path.exists() or files is not None and not files:
+        return _schema(table).empty_table()
+    count_read(path.stat().st_size)
+    filters = [("file", "in", sorted(files))] if files is not None else None
+    return pq.read_table(path, filters=filters, schema=_schema(table))
+
+
+def refresh_store(directory, reports, store_dir=STORE_DIR):
+    # Only reports that are new or whose mtime/size changed are parsed; the rows of unchanged reports
+    # are copied over from the existing Parquet files and those of deleted reports are dropped
+    store = store_path(directory, store_dir)
+    stored = {row["file"]: (row["mtime_ns"], row["size"])
+              for row in _read(store, "reports").select(["file", "mtime_ns", "size"]).to_pylist()}
+    current = {path: (mtime_ns, size) for path, mtime_ns, size in reports}
+    unchanged = {path for path, version in current.items() if stored.get(path) == version}
+    changed = sorted(set(current) - unchanged)
+    removed = set(stored) - set(current)
+    failed = []
+    if changed or removed:
+        parsed = {table: [] for table in SCHEMAS}
+        for path in changed:
+            # A truncated or half-written report is skipped (and retried on the next refresh, as it
+            # is not recorded in the reports table) instead of taking down the whole page
+            try:
+                report = parse_report(path)
+            except (OSError, ValueError, IndexError):
+                failed.append(os.path.basename(path))
+                continue
+            for table, rows in report.items():
+                parsed[table].extend(rows)
+        store.mkdir(parents=True, exist_ok=True)
+        for table, rows in parsed.items():
+            schema = _schema(table)
+            fresh = pa.Table.from_pylist([dict(zip(schema.names, row)) for row in rows], schema=schema)
+            merged = pa.concat_tables([_read(store, table, unchanged), fresh])
+            pq.write_table(merged, store / f"{table}.parquet.tmp")
+        # Only renamed once every table is written, and the reports table last: a report only counts
+        # as up to date once all of its rows are in place
+        for table in sorted(SCHEMAS, key=lambda table: table == "reports"):
+            os.replace(store / f"{table}.parquet.tmp", store / f"{table}.parquet")
+    return {"parsed": len(changed) - len(failed), "removed": len(removed), "reports": len(current) - len(failed),
+            "failed": failed}
+
+
+@st.cache_resource(max_entries=4, show_spinner="Reading Falco reports ...")
+def load_qc(directory, reports):
+    # Keyed by the scan, so reopening the page reads nothing until a report is added or rewritten
+    refresh = refresh_store(directory, reports, STORE_DIR)
+    store = store_path(directory, STORE_DIR)
+    return {"refresh": refresh, **{table: _read(store, table) for table in SCHEMAS}}
@@ -0,0 +1,70 @@
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import streamlit as st
+from PIL import Image, features
+
+from utils.asset_loader import asset_version, load_bytes, load_image
+
+# Resized copies survive restarts; the file name carries the hash of the source image
+VARIANT_DIR = Path.home() / ".cache" / "logbook" / "images"
+
+# Displays are assumed to be HiDPI, so a variant is rendered at twice its display width
+DENSITY = 2
+
+FORMATS = ("webp", "png") if features.check("webp") else ("png",)
+
+
+def _encode(image, fmt):
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        image.save(buffer, "WEBP", quality=85, method=6)
+    else:
+        image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _variant(path, digest, width, fmt):
+    target = VARIANT_DIR / f"{Path(path).stem}-{digest[:16]}-{width}.{fmt}"
+    if target.exists():
+        return target.read_bytes()
+    image = load_image(path)
+    if image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    data = _encode(image, fmt)
+    VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+    # Written under a name of its own and renamed into place, so a concurrent session never reads
+    # (and keeps serving) a half-written variant
+    with tempfile.NamedTemporaryFile(dir=VARIANT_DIR, suffix=".tmp", delete=False) as fh:
+        fh.write(data)
+    os.replace(fh.name, target)
+    return data
+
+
+# One variant per (source version, display width): the image is never upscaled past its source,
+# and the smaller of the WebP and PNG encodings is served
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _best_variant(path, mtime_ns, width):
+    source = load_bytes(path)
+    digest = hashlib.sha256(source).hexdigest()
+    pixels = min(width * DENSITY, load_image(path).width)
+    return min((_variant(path, digest, pixels, fmt) for fmt in FORMATS), key=len)
+
+
+def responsive_image(path, width):
+    # Smallest encoded image that stays sharp at `width` CSS pixels, or None if the file is missing
+    mtime_ns = asset_version(path)
+    if mtime_ns is None:
+        return None
+    return _best_variant(str(path), mtime_ns, width)
+
+
+def render_image(path, width, caption=None):
+    data = responsive_image(path, width)
+    if data is None:
+        st.error(f"{Path(path).name} does not exist.")
+        return
+    st.image(data, width=width, caption=caption)
@@ -0,0 +1,58 @@
+import ast
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def startup_imports(script):
+    # Top-level modules imported by the app script, i.e. what every process start pays for
+    tree = ast.parse(Path(script).read_text(encoding="utf-8"))
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def parse_importtime(stderr):
+    # Rows of `python -X importtime`: module, nesting depth, self and cumulative time in ms
+    rows = []
+    for line in stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({"module": module, "depth": len(indent) // 2, "self_ms": int(self_us) / 1000,
+                         "cumulative_ms": int(cumulative_us) / 1000})
+    return rows
+
+
+# Measured in a fresh interpreter, once per version of the app script
+@st.cache_data(max_entries=4, show_spinner="Measuring import times ...")
+def measure_imports(script, mtime_ns):
+    modules = startup_imports(script)
+    code = "; ".join(f"import {name}" for name in modules)
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=APP_DIR,
+                             capture_output=True, text=True)
+    rows = parse_importtime(process.stderr)
+    top = [row for row in rows if row["depth"] == 0]
+    return {
+        "modules": modules,
+        "total_ms": sum(row["cumulative_ms"] for row in top),
+        "top_level": sorted(top, key=lambda row: row["cumulative_ms"], reverse=True),
+        "slowest": sorted(rows, key=lambda row: row["self_ms"], reverse=True)[:25],
+        "returncode": process.returncode,
+    }
+
+
+def importtime_report(script):
+    script = Path(script)
+    return measure_imports(str(script), script.stat().st_mtime_ns)
@@ -0,0 +1,29 @@
+import importlib
+import time
+
+# Seconds spent importing each lazily loaded module in this process
+IMPORT_TIMES = {}
+
+
+class LazyModule:
+    # Stands in for a module and imports it on first attribute access, so a heavy
+    # dependency is only paid for by the sections that actually use it
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            IMPORT_TIMES[self._name] = time.perf_counter() - started
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
@@ -0,0 +1,98 @@
+import hashlib
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+import streamlit as st
+
+from utils.asset_loader import load_bytes
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+# Every downloadable asset of the logbook: key -> (file name in assets/, button label, MIME type)
+ASSETS = {
+    "gzip": ("gzip.sh", "Download Gzip Bash Script", "application/x-sh"),
+    "fastq_compress": ("fastq_compress.py", "Download Parallel FASTQ Compression Script", "text/x-python"),
+    "falco1": ("falco1.sh", "Download Falco Bash Script", "application/x-sh"),
+    "fastp": ("fastp.sh", "Download Fastp Bash Script", "application/x-sh"),
+    "falco2": ("falco2.sh", "Download Falco Bash Script", "application/x-sh"),
+    "kmer_count": ("kmer_count.py", "Download K-mer Counting Script", "text/x-python"),
+    "genome_estimate": ("genome_estimate.py", "Download Genome Estimate Script", "text/x-python"),
+    "masurca": ("MaSuRCA_config.txt", "Download MaSuRCA Configuration File", "text/plain"),
+    "racon_cpu": ("polishing_with_RaconCPU_4_rounds.sh", "Download Racon-CPU file to automate 4 polishing rounds", "application/x-sh"),
+    "racon_gpu": ("polishing_with_RaconGPU_4_rounds.sh", "Download Racon-GPU file to automate 4 polishing rounds", "application/x-sh"),
+    "racon_polish": ("racon_polish.py", "Download Resumable Racon Polishing Script", "text/x-python"),
+    "longstitch": ("run_longstitch.sh", "Download Longstitch Script", "application/x-sh"),
+    "busco_plot": ("busco_figure.R", "Download BUSCO plot R Code", "text/x-r"),
+    "braker3": ("braker3_perl_module_installation.sh", "Download Braker3 Perl Module Installation Script", "application/x-sh"),
+    "star": ("RNAseq_alignment_with_STAR.sh", "Download STAR Bash Script", "application/x-sh"),
+    "rnaseq_pipeline": ("rnaseq_pipeline.py", "Download RNA-seq Pipeline Script", "text/x-python"),
+    "deseq2": ("deseq2.Rmd", "Download DESeq2 R Script", "text/markdown"),
+    "gromacs": ("Gromacs_codes.txt", "Download Gromacs Code", "text/plain"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    key: str
+    path: Path
+    label: str
+    mime: str
+    sha256: str | None
+    size: int | None
+
+    @property
+    def exists(self):
+        return self.sha256 is not None
+
+
+def _describe(key, assets_dir):
+    file_name, label, mime = ASSETS[key]
+    path = assets_dir / file_name
+    if not path.is_file():
+        return Asset(key, path, label, mime, None, None)
+    data = path.read_bytes()
+    return Asset(key, path, label, mime, hashlib.sha256(data).hexdigest(), len(data))
+
+
+def asset_stats(assets_dir=ASSETS_DIR):
+    # (key, mtime_ns, size) of every asset, None for a missing file; unlike the directory mtime,
+    # these also change when a file is edited in place
+    stats = []
+    for key, (file_name, _, _) in ASSETS.items():
+        try:
+            stat = (Path(assets_dir) / file_name).stat()
+        except FileNotFoundError:
+            stats.append((key, None, None))
+        else:
+            stats.append((key, stat.st_mtime_ns, stat.st_size))
+    return tuple(stats)
+
+
+# Built once and shared by every session; adding, removing, replacing or editing a file in
+# assets/ changes its stats and therefore rebuilds the manifest on the next rerun
+@st.cache_resource(max_entries=4, show_spinner=False)
+def build_manifest(assets_dir, stats):
+    return {key: _describe(key, Path(assets_dir)) for key in ASSETS}
+
+
+def get_manifest():
+    return build_manifest(str(ASSETS_DIR), asset_stats())
+
+
+def render_download(key, scope="page"):
+    # The file is only read (through the cached loader) when the button is clicked,
+    # and clicking it does not rerun the page; `scope` keeps the widget key unique
+    # when the same asset is shown twice (e.g. in a search result and on the page)
+    asset = get_manifest()[key]
+    if not asset.exists:
+        st.error(f"{asset.path.name} does not exist.")
+        return
+    st.download_button(
+        label=asset.label,
+        data=partial(load_bytes, asset.path),
+        file_name=asset.path.name,
+        mime=asset.mime,
+        key=f"download_{scope}_{asset.key}",
+        on_click="ignore",
+    )
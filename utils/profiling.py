@@ -0,0 +1,176 @@
+import contextvars
+import cProfile
+import io
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Samples kept across reruns and sessions; older ones are dropped first
+RING_SIZE = 5000
+
+# Lines of cProfile output kept per profiled section
+PROFILE_LINES = 25
+
+# Sections open in the current script run, innermost last
+_active = contextvars.ContextVar("profiling_sections", default=())
+
+
+@dataclass(slots=True)
+class Sample:
+    section: str
+    seconds: float
+    elements: int
+    sent_bytes: int
+    read_bytes: int
+    session: str
+    created: float
+
+
+class Recorder:
+    # Ring buffer of section samples and the latest cProfile report per section,
+    # shared by every session of the app process
+
+    def __init__(self, size=RING_SIZE):
+        self.samples = deque(maxlen=size)
+        self.profiles = {}
+        self.lock = threading.Lock()
+
+    def add(self, sample, profile=None):
+        with self.lock:
+            self.samples.append(sample)
+            if profile is not None:
+                self.profiles[sample.section] = profile
+
+    def summary(self):
+        # p50/p95 wall time and mean element and byte counts per section
+        # (numpy is only imported once the panel is opened, not on every cold start)
+        import numpy as np
+
+        with self.lock:
+            samples = list(self.samples)
+        sections = {}
+        for sample in samples:
+            sections.setdefault(sample.section, []).append(sample)
+        rows = []
+        for name, group in sections.items():
+            seconds = np.array([sample.seconds for sample in group]) * 1000
+            rows.append({
+                "section": name,
+                "runs": len(group),
+                "sessions": len({sample.session for sample in group}),
+                "p50_ms": float(np.percentile(seconds, 50)),
+                "p95_ms": float(np.percentile(seconds, 95)),
+                "elements": float(np.mean([sample.elements for sample in group])),
+                "sent_bytes": float(np.mean([sample.sent_bytes for sample in group])),
+                "read_bytes": float(np.mean([sample.read_bytes for sample in group])),
+            })
+        return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+            self.profiles.clear()
+
+
+@st.cache_resource
+def get_recorder():
+    return Recorder()
+
+
+def count_read(nbytes):
+    # Credit bytes read from disk to every open section
+    for stats in _active.get():
+        stats[2] += nbytes
+
+
+def _count_deltas(ctx):
+    # Every element the script emits goes through ctx.enqueue as a ForwardMsg; wrapping it once per
+    # script runner credits the element and its websocket payload to the open sections
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None or getattr(enqueue, "counts_sections", False):
+        return
+
+    def counted(msg):
+        sections = _active.get()
+        if sections and msg.HasField("delta"):
+            size = msg.ByteSize()
+            for stats in sections:
+                stats[0] += 1
+                stats[1] += size
+        return enqueue(msg)
+
+    counted.counts_sections = True
+    ctx._enqueue = counted
+
+
+@contextmanager
+def section(name, profile=False):
+    # Time a block of the page; with `profile`, the outermost profiled section also runs under cProfile
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        _count_deltas(ctx)
+    stats = [0, 0, 0]
+    parents = _active.get()
+    token = _active.set(parents + (stats,))
+    profiler = cProfile.Profile() if profile and not parents else None
+    if profiler:
+        profiler.enable()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        report = None
+        if profiler:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            report = out.getvalue()
+        _active.reset(token)
+        session = ctx.session_id if ctx else "-"
+        get_recorder().add(Sample(name, elapsed, stats[0], stats[1], stats[2], session, time.time()), report)
+
+
+def settings():
+    # Toggles of the diagnostics panel for this session
+    state = st.session_state
+    return {"panel": state.get("diagnostics_panel", False), "steps": state.get("diagnostics_steps", False),
+            "profile": state.get("diagnostics_profile", False)}
+
+
+def render_panel():
+    # Sidebar panel with p50/p95 per section across reruns and sessions
+    if not st.toggle("Diagnostics panel", key="diagnostics_panel"):
+        return
+    st.toggle("Time every step", key="diagnostics_steps",
+              help="renders the phase step by step so each step gets its own timing")
+    st.toggle("cProfile sections", key="diagnostics_profile")
+    _render_samples()
+
+
+# Refreshing or resetting the numbers reruns only this fragment, not the page being measured
+@st.fragment
+def _render_samples():
+    recorder = get_recorder()
+    left, right = st.columns(2)
+    left.button("Refresh")
+    if right.button("Reset samples"):
+        recorder.clear()
+    rows = recorder.summary()
+    st.caption(f"{len(recorder.samples)} samples, up to {recorder.samples.maxlen} kept")
+    if rows:
+        st.dataframe(rows, hide_index=True,
+                     column_config={"p50_ms": st.column_config.NumberColumn(format="%.1f"),
+                                    "p95_ms": st.column_config.NumberColumn(format="%.1f"),
+                                    "elements": st.column_config.NumberColumn(format="%.0f"),
+                                    "sent_bytes": st.column_config.NumberColumn(format="%.0f"),
+                                    "read_bytes": st.column_config.NumberColumn(format="%.0f")})
+    for name, report in sorted(recorder.profiles.items()):
+        with st.expander(f"cProfile: {name}"):
+            st.code(report, language="text")
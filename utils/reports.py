@@ -0,0 +1,22 @@
+import hashlib
+import os
+from pathlib import Path
+
+# Shared by the tool report loaders (utils/fastqc.py, utils/fastp.py): finding the reports of a
+# directory and the cache location of what was parsed out of them
+
+
+def scan_reports(directory, suffix):
+    # (file, mtime_ns, size) of every report ending in `suffix`, from directory entries only; this is
+    # the cache key of the parsed reports, so an unchanged directory costs one scandir per rerun
+    if not os.path.isdir(directory):
+        return ()
+    with os.scandir(directory) as entries:
+        return tuple(sorted((entry.path, entry.stat().st_mtime_ns, entry.stat().st_size)
+                            for entry in entries if entry.name.endswith(suffix) and entry.is_file()))
+
+
+def store_path(directory, store_dir):
+    # One store per report directory, named after the hash of its real path
+    digest = hashlib.sha256(os.path.realpath(directory).encode("utf-8")).hexdigest()[:16]
+    return Path(store_dir) / digest
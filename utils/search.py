@@ -0,0 +1,184 @@
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+import streamlit as st
+
+from utils.asset_loader import load_bytes
+from utils.content import CONTENT_DIR, load_page, step_title
+from utils.manifest import asset_stats, get_manifest
+from utils.profiling import section
+
+TOKEN = re.compile(r"[A-Za-z0-9_]+")
+
+# Step headings rank above commands, commands above notes and downloadable files
+KIND_WEIGHT = {"step": 2.0, "code": 1.5, "note": 1.0, "asset": 1.0}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+MAX_HITS = 10
+SNIPPET_LENGTH = 120
+
+
+@dataclass(frozen=True, slots=True)
+class Document:
+    kind: str
+    phase: str
+    step: int
+    title: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Index:
+    documents: list
+    postings: dict
+    vocabulary: list
+    lengths: list
+    average_length: float
+
+
+def tokenize(text):
+    return [token.lower() for token in TOKEN.findall(text)]
+
+
+def _documents(phases):
+    # Every step heading, command and note of every phase, plus each downloadable file,
+    # which points back to the step that offers it
+    documents = []
+    asset_steps = {}
+    for label, name in phases.items():
+        for step, section in enumerate(load_page(name).sections):
+            title = section.title or label
+            if section.title:
+                documents.append(Document("step", name, step, title, section.title))
+            for block in section.blocks:
+                if "code" in block:
+                    documents.append(Document("code", name, step, title, block["code"].strip()))
+                elif "text" in block and block["text"].strip("-#* ") and step_title(block["text"]) != section.title:
+                    documents.append(Document("note", name, step, title, block["text"]))
+                elif "asset" in block:
+                    asset_steps.setdefault(block["asset"], (name, step, title))
+    for key, asset in get_manifest().items():
+        data = load_bytes(asset.path) if asset.exists else None
+        if data is not None and key in asset_steps:
+            name, step, title = asset_steps[key]
+            documents.append(Document("asset", name, step, f"{asset.path.name} ({title})",
+                                      data.decode("utf-8", errors="replace")))
+    return documents
+
+
+# Built once per version of the content and assets; a query only touches the postings of its terms
+@st.cache_resource(max_entries=4, show_spinner=False)
+def build_index(phases, version):
+    documents = _documents(dict(phases))
+    postings = defaultdict(dict)
+    lengths = []
+    for doc_id, document in enumerate(documents):
+        counts = Counter(tokenize(document.text))
+        lengths.append(sum(counts.values()))
+        for token, count in counts.items():
+            postings[token][doc_id] = count
+    average = sum(lengths) / len(lengths) if lengths else 0.0
+    return Index(documents, dict(postings), sorted(postings), lengths, average)
+
+
+def get_index(phases):
+    # Per-file stats of the pages and the assets: an asset edited in place does not change the
+    # mtime of assets/, only its own
+    version = tuple((path.name, path.stat().st_mtime_ns) for path in sorted(CONTENT_DIR.glob("*.toml")))
+    return build_index(tuple(phases.items()), version + asset_stats())
+
+
+def _expand(index, term):
+    # A query term also matches every indexed token it is a prefix of (search as you type),
+    # at half the weight of an exact match
+    start = bisect.bisect_left(index.vocabulary, term)
+    matches = {}
+    for token in index.vocabulary[start:start + 50]:
+        if not token.startswith(term):
+            break
+        matches[token] = 1.0 if token == term else 0.5
+    return matches
+
+
+def search(index, query, limit=MAX_HITS):
+    # Ranked hits (score, document, matched tokens); every query term has to match
+    terms = tokenize(query)
+    if not terms:
+        return []
+    total = len(index.documents)
+    scores = None
+    matched = defaultdict(set)
+    for term in terms:
+        term_scores = defaultdict(float)
+        for token, weight in _expand(index, term).items():
+            posting = index.postings[token]
+            idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, count in posting.items():
+                norm = count + K1 * (1 - B + B * index.lengths[doc_id] / index.average_length)
+                term_scores[doc_id] += weight * idf * count * (K1 + 1) / norm
+                matched[doc_id].add(token)
+        scores = term_scores if scores is None else {doc_id: score + term_scores[doc_id]
+                                                     for doc_id, score in scores.items() if doc_id in term_scores}
+    ranked = sorted(((score * KIND_WEIGHT[index.documents[doc_id].kind], doc_id) for doc_id, score in scores.items()),
+                    reverse=True)
+
+    # One hit per step, carrying the snippet of its best-matching document
+    hits = []
+    seen = set()
+    for score, doc_id in ranked:
+        document = index.documents[doc_id]
+        if (document.phase, document.step) in seen:
+            continue
+        seen.add((document.phase, document.step))
+        hits.append((score, document, matched[doc_id]))
+        if len(hits) == limit:
+            break
+    return hits
+
+
+def _escape(text):
+    return re.sub(r"([\\`*_{}\[\]<>()#+\-.!|$~:])", r"\\\1", text)
+
+
+def snippet(document, tokens, length=SNIPPET_LENGTH):
+    # The line with the most matched tokens, cut around the first match, with the matches in bold
+    lines = [line.strip() for line in document.text.splitlines() if line.strip()] or [""]
+    line = max(lines, key=lambda line: sum(token.lower() in tokens for token in TOKEN.findall(line)))
+    first = next((match.start() for match in TOKEN.finditer(line) if match.group().lower() in tokens), 0)
+    begin = max(0, first - length // 3)
+    line = ("…" if begin else "") + line[begin:begin + length] + ("…" if begin + length < len(line) else "")
+    parts = []
+    position = 0
+    for match in TOKEN.finditer(line):
+        if match.group().lower() in tokens:
+            parts.append(_escape(line[position:match.start()]) + f"**{match.group()}**")
+            position = match.end()
+    parts.append(_escape(line[position:]))
+    return "".join(parts)
+
+
+# A fragment: typing a query reruns only the search box and its hits, never the phase page
+@st.fragment
+def render_search(phases):
+    # Sidebar search box; every hit links to its phase and step through the ?phase=&step= query parameters
+    with section("search"):
+        query = st.text_input("🔎 Search steps, commands & scripts", placeholder="fastp, jellyfish, STAR ...")
+        if not query.strip():
+            return
+        hits = search(get_index(phases), query)
+        if not hits:
+            st.caption("No matches.")
+            return
+        labels = {name: label.split(":")[0] for label, name in phases.items()}
+        lines = []
+        for _, document, tokens in hits:
+            link = f"?phase={document.phase}&step={document.step}"
+            lines.append(f"- [{_escape(labels[document.phase])} · {_escape(document.title[:60])}]({link})  \n"
+                         f"  {document.kind}: {snippet(document, tokens)}")
+        st.markdown("\n".join(lines))